@@ -9,12 +9,28 @@ from urllib.request import urlopen
 
 from .to_python import openapi_to_pydantic_code
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _loads(data: bytes) -> dict[str, object]:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (BOMs, NaN, huge floats);
+            # keep accepting whatever json.loads accepts.
+            pass
+    return json.loads(data)
+
 
 def _load_schema(source: str) -> dict[str, object]:
     if source.startswith("http://") or source.startswith("https://"):
         with urlopen(source) as response:  # nosec - user-provided URL
-            return json.loads(response.read().decode("utf-8"))
-    return json.loads(Path(source).read_text(encoding="utf-8"))
+            return _loads(response.read())
+    return _loads(Path(source).read_bytes())
 
 
 def main() -> None:
@@ -52,6 +68,8 @@ def main() -> None:
 
         schema = _load_schema(args.input)
         custom_lines = [include_content] if include_content else None
+        # Generate fully before touching the output, so a failed run leaves the
+        # previous file intact.
         code = openapi_to_pydantic_code(
             schema,
             custom_import_lines=custom_lines,
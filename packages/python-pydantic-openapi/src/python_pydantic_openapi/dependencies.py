@@ -1,103 +1,119 @@
 from __future__ import annotations
 
+import sys
+from collections import deque
 from typing import Any
 from urllib.parse import unquote
 
 from .types import AnySchema
 
-
-def extract_schema_dependencies(schema: AnySchema | None) -> list[str]:
+_REF_KEYS = (
+    "items",
+    "oneOf",
+    "allOf",
+    "anyOf",
+    "not",
+    "if",
+    "then",
+    "else",
+    "prefixItems",
+    "contains",
+    "propertyNames",
+    "dependentSchemas",
+)
+
+
+# Per-run memo keyed by ``id(schema)``, with the schema kept alive alongside so the id
+# cannot be recycled while the entry exists.
+DependencyCache = dict[int, tuple[AnySchema | None, list[str]]]
+
+
+def extract_schema_dependencies(
+    schema: AnySchema | None, cache: DependencyCache | None = None
+) -> list[str]:
+    if cache is None:
+        return _extract_schema_dependencies(schema)
+    cached = cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    deps = _extract_schema_dependencies(schema)
+    cache[id(schema)] = (schema, deps)
+    return deps
+
+
+def _extract_schema_dependencies(schema: AnySchema | None) -> list[str]:
     dependencies: set[str] = set()
     visited: set[int] = set()
+    stack: list[Any] = [schema]
 
-    def traverse(obj: Any) -> None:
+    while stack:
+        obj = stack.pop()
         if obj is None or not isinstance(obj, (dict, list)):
-            return
+            continue
 
         obj_id = id(obj)
         if obj_id in visited:
-            return
+            continue
         visited.add(obj_id)
 
-        if isinstance(obj, dict) and isinstance(obj.get("$ref"), str):
-            match = obj["$ref"].split("#/components/schemas/")
-            if len(match) == 2 and match[1]:
-                dependencies.add(unquote(match[1]))
-            return
-
         if isinstance(obj, list):
-            for item in obj:
-                traverse(item)
-            return
-
-        if isinstance(obj, dict):
-            props = obj.get("properties")
-            if isinstance(props, dict):
-                for value in props.values():
-                    traverse(value)
-
-            for key in [
-                "items",
-                "oneOf",
-                "allOf",
-                "anyOf",
-                "not",
-                "if",
-                "then",
-                "else",
-                "prefixItems",
-                "contains",
-                "propertyNames",
-                "dependentSchemas",
-            ]:
-                if key in obj:
-                    traverse(obj[key])
-
-            additional = obj.get("additionalProperties")
-            if isinstance(additional, dict):
-                traverse(additional)
-
-            discriminator = obj.get("discriminator")
-            if isinstance(discriminator, dict):
-                mapping = discriminator.get("mapping")
-                if isinstance(mapping, dict):
-                    for value in mapping.values():
-                        traverse(value)
-
-    traverse(schema)
+            stack.extend(obj)
+            continue
+
+        if isinstance(obj.get("$ref"), str):
+            _, sep, name = obj["$ref"].partition("#/components/schemas/")
+            if sep and name:
+                dependencies.add(sys.intern(unquote(name)))
+            continue
+
+        props = obj.get("properties")
+        if isinstance(props, dict):
+            stack.extend(props.values())
+
+        for key in _REF_KEYS:
+            if key in obj:
+                stack.append(obj[key])
+
+        additional = obj.get("additionalProperties")
+        if isinstance(additional, dict):
+            stack.append(additional)
+
+        discriminator = obj.get("discriminator")
+        if isinstance(discriminator, dict):
+            mapping = discriminator.get("mapping")
+            if isinstance(mapping, dict):
+                stack.extend(mapping.values())
+
     return list(dependencies)
 
 
-def topological_sort_schemas(schemas: dict[str, AnySchema]) -> list[str]:
+def topological_sort_schemas(
+    schemas: dict[str, AnySchema], cache: DependencyCache | None = None
+) -> list[str]:
     schema_names = list(schemas.keys())
-    dependencies: dict[str, list[str]] = {name: [] for name in schema_names}
-    dependents: dict[str, list[str]] = {name: [] for name in schema_names}
-    in_degree: dict[str, int] = {name: 0 for name in schema_names}
+    dependents: dict[str, list[str]] = {}
+    in_degree: dict[str, int] = {}
 
     for name, schema in schemas.items():
-        deps = extract_schema_dependencies(schema)
-        valid_deps = [dep for dep in deps if dep in schemas]
-        dependencies[name] = valid_deps
+        name = sys.intern(name)
+        valid_deps = [dep for dep in extract_schema_dependencies(schema, cache) if dep in schemas]
+        in_degree[name] = len(valid_deps)
         for dep in valid_deps:
-            dependents[dep].append(name)
-
-    for name, deps in dependencies.items():
-        in_degree[name] = len(deps)
+            dependents.setdefault(dep, []).append(name)
 
-    queue = [name for name, degree in in_degree.items() if degree == 0]
+    queue = deque(name for name, degree in in_degree.items() if degree == 0)
     sorted_names: list[str] = []
 
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
         sorted_names.append(current)
-        for dependent in dependents[current]:
+        for dependent in dependents.get(current, ()):
             in_degree[dependent] -= 1
             if in_degree[dependent] == 0:
                 queue.append(dependent)
 
     if len(sorted_names) != len(schema_names):
-        for name in schema_names:
-            if name not in sorted_names:
-                sorted_names.append(name)
+        emitted = set(sorted_names)
+        sorted_names.extend(name for name in schema_names if name not in emitted)
 
     return sorted_names
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import io
+import keyword
+import re
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, TextIO, overload
 
-from .dependencies import topological_sort_schemas
+from .dependencies import (
+    DependencyCache,
+    extract_schema_dependencies,
+    topological_sort_schemas,
+)
 from .lowering import LoweringContext, NamedSchema, lower_named_schema
 from .rendering import (
     RenderContext,
@@ -15,7 +25,7 @@ from .rendering import (
 )
 from .routes import (
     RouteInfo,
-    build_route_schema_name,
+    RouteParameter,
     generate_route_schema_names,
     parse_openapi_paths,
 )
@@ -23,6 +33,7 @@ from .schema_dedup import (
     NamedSchema as DedupNamedSchema,
 )
 from .schema_dedup import (
+    SchemaRegistry,
     create_schema_registry,
     find_common_schemas,
     get_schema_fingerprint,
@@ -32,124 +43,227 @@ from .schema_dedup import (
 from .types import AnySchema
 
 _VALID_IDENTIFIER_CHARS = set("_abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+_ASCII_IDENTIFIER_TRANSLATION = {
+    code: "_" for code in range(128) if chr(code) not in _VALID_IDENTIFIER_CHARS
+}
+_NON_IDENTIFIER_CHAR = re.compile(r"[^A-Za-z0-9_]")
+
+_DEFAULT_BASES = ("BaseModel",)
+
+# Field line templates keyed by (is_required, needs_alias); formatted with
+# (attribute name, type expression, property name).
+_FIELD_TEMPLATES = {
+    (True, False): "    {0}: {1}",
+    (True, True): "    {0}: {1} = Field(alias={2!r})",
+    (False, False): "    {0}: {1} = None",
+    (False, True): "    {0}: {1} = Field(default=None, alias={2!r})",
+}
 
 
 @dataclass(slots=True)
 class EmissionState:
     render_context: RenderContext = field(default_factory=RenderContext)
     rebuild_names: list[str] = field(default_factory=list)
+    # With ``minimize_rebuild``, only models that reference a not-yet-emitted name get a
+    # ``model_rebuild()`` call; the rest are complete as soon as they are defined.
+    minimize_rebuild: bool = False
+    emitted_names: set[str] = field(default_factory=set)
+    dependencies: DependencyCache = field(default_factory=dict)
+
+
+class _LineWriter:
+    """Writes lines to a text stream with the same layout as ``"\n".join(lines)``."""
+
+    __slots__ = ("_write", "_separator")
+
+    def __init__(self, out: TextIO) -> None:
+        self._write = out.write
+        self._separator = ""
+
+    def line(self, text: str = "") -> None:
+        self._write(self._separator)
+        self._write(text)
+        self._separator = "\n"
+
+    def lines(self, texts: Iterable[str]) -> None:
+        write = self._write
+        separator = self._separator
+        for text in texts:
+            write(separator)
+            write(text)
+            separator = "\n"
+        self._separator = separator
+
+
+@overload
+def openapi_to_pydantic_code(
+    openapi: dict[str, Any],
+    custom_import_lines: list[str] | None = None,
+    options: dict[str, Any] | None = None,
+    *,
+    out: None = None,
+) -> str: ...
 
 
+@overload
 def openapi_to_pydantic_code(
     openapi: dict[str, Any],
     custom_import_lines: list[str] | None = None,
     options: dict[str, Any] | None = None,
-) -> str:
+    *,
+    out: TextIO,
+) -> None: ...
+
+
+def openapi_to_pydantic_code(
+    openapi: dict[str, Any],
+    custom_import_lines: list[str] | None = None,
+    options: dict[str, Any] | None = None,
+    *,
+    out: TextIO | None = None,
+) -> str | None:
+    """Generate a Pydantic module; it is written to ``out`` if given, otherwise returned."""
     include_routes = bool(options.get("include_routes") if options else False)
+    minimize_rebuild = bool(options.get("minimize_rebuild") if options else False)
     components = openapi.get("components")
     schemas = components.get("schemas") if isinstance(components, dict) else {}
     if not isinstance(schemas, dict):
         schemas = {}
 
+    dependency_cache: DependencyCache = {}
     lowering_context = LoweringContext(set(schemas.keys()))
     lowered_components: list[NamedSchema] = []
-    for name in topological_sort_schemas(schemas):
+    for name in topological_sort_schemas(schemas, dependency_cache):
         schema = schemas.get(name)
         if schema is None:
             continue
         lowered_components.extend(lower_named_schema(lowering_context, name, schema))
 
-    lines = _build_module_preamble(custom_import_lines)
-    state = EmissionState()
+    buffer: io.StringIO | None = None
+    if out is None:
+        out = buffer = io.StringIO()
+    writer = _LineWriter(out)
+    _emit_module_preamble(writer, custom_import_lines)
     registry = create_schema_registry()
+    state = EmissionState(
+        render_context=RenderContext(fingerprints=registry.fingerprints),
+        minimize_rebuild=minimize_rebuild,
+        dependencies=dependency_cache,
+    )
 
     for named_schema in lowered_components:
-        lines.extend(_emit_named_schema(named_schema.name, named_schema.schema, state))
+        _emit_named_schema(writer, named_schema.name, named_schema.schema, state)
         pre_register_schema(
             registry,
             named_schema.name,
-            get_schema_fingerprint(named_schema.schema),
+            get_schema_fingerprint(named_schema.schema, registry.fingerprints),
         )
 
     if include_routes:
         routes = parse_openapi_paths(openapi)
         if routes:
-            route_lines, schema_name_to_canonical = _emit_route_schemas(
-                routes,
+            route_emits = _build_route_emits(routes)
+            route_schemas, schema_name_to_canonical = _register_route_schemas(
+                route_emits,
                 lowering_context,
                 registry,
-                state,
             )
-            if route_lines:
-                lines.append("# Route Schemas")
-                lines.extend(route_lines)
-                lines.append("")
-
-            lines.extend(_emit_model_rebuilds(state.rebuild_names))
-            if route_lines:
-                lines.append("")
-            lines.extend(_generate_request_response_objects(routes, schema_name_to_canonical))
-            return "\n".join(lines)
-
-    lines.extend(_emit_model_rebuilds(state.rebuild_names))
-    return "\n".join(lines)
-
-
-def _build_module_preamble(custom_import_lines: list[str] | None) -> list[str]:
-    lines = [
-        "# This file was automatically generated from OpenAPI schema",
-        "# Do not manually edit this file",
-        "from __future__ import annotations",
-        "",
-        "from typing import Any, Annotated, Literal, Optional, Union",
-        "from datetime import date, datetime",
-        "from uuid import UUID",
-        "",
-        "from pydantic import BaseModel, ConfigDict, Field, RootModel",
-        "from pydantic import AnyUrl, EmailStr",
-        "from python_pydantic_openapi.all_of import all_of",
-        "",
-    ]
+            if route_schemas:
+                writer.line("# Route Schemas")
+                for named_schema in route_schemas:
+                    _emit_named_schema(writer, named_schema.name, named_schema.schema, state)
+                writer.line()
+
+            _emit_model_rebuilds(writer, state.rebuild_names)
+            if route_schemas:
+                writer.line()
+            _generate_request_response_objects(writer, route_emits, schema_name_to_canonical)
+            return buffer.getvalue() if buffer is not None else None
+
+    _emit_model_rebuilds(writer, state.rebuild_names)
+    return buffer.getvalue() if buffer is not None else None
+
+
+_MODULE_PREAMBLE = (
+    "# This file was automatically generated from OpenAPI schema",
+    "# Do not manually edit this file",
+    "from __future__ import annotations",
+    "",
+    "from typing import Any, Annotated, Literal, Optional, Union",
+    "from datetime import date, datetime",
+    "from uuid import UUID",
+    "",
+    "from pydantic.config import ConfigDict",
+    "from pydantic.fields import Field",
+    "from pydantic.main import BaseModel",
+    "from pydantic.networks import AnyUrl, EmailStr",
+    "from pydantic.root_model import RootModel",
+    "from python_pydantic_openapi.all_of import all_of",
+    "",
+)
+
+
+def _emit_module_preamble(writer: _LineWriter, custom_import_lines: list[str] | None) -> None:
+    writer.lines(_MODULE_PREAMBLE)
     if custom_import_lines:
-        lines.extend(custom_import_lines)
-        lines.append("")
-    return lines
+        writer.lines(custom_import_lines)
+        writer.line()
 
 
-def _emit_named_schema(name: str, schema: AnySchema, state: EmissionState) -> list[str]:
+def _emit_named_schema(
+    writer: _LineWriter, name: str, schema: AnySchema, state: EmissionState
+) -> None:
     if is_object_model_schema(schema):
-        return _emit_object_model(name, schema, state)
-    return _emit_root_model(name, schema, state)
+        _emit_object_model(writer, name, schema, state.render_context)
+    else:
+        _emit_root_model(writer, name, schema, state)
+
+    if not state.minimize_rebuild or any(
+        dependency != name and dependency not in state.emitted_names
+        for dependency in extract_schema_dependencies(schema, state.dependencies)
+    ):
+        state.rebuild_names.append(name)
+    state.emitted_names.add(name)
 
 
-def _emit_object_model(name: str, schema: AnySchema, state: EmissionState) -> list[str]:
-    all_of = schema.get("allOf") if isinstance(schema, dict) else None
+def _emit_object_model(
+    writer: _LineWriter, name: str, schema: AnySchema, context: RenderContext
+) -> None:
+    all_of = schema.get("allOf")
     if isinstance(all_of, list):
-        base_classes, merged_schema = _merge_allof_object_schema(all_of)
-        model_lines = _build_model_lines(name, merged_schema, base_classes=base_classes or None)
-        model_lines.insert(1, f"    __openapi_allof__ = {all_of!r}")
+        base_classes, merged_schema, required = _merge_allof_object_schema(all_of)
+        _emit_model_lines(
+            writer,
+            name,
+            merged_schema,
+            required,
+            context,
+            base_classes=base_classes or None,
+            class_attributes=(f"    __openapi_allof__ = {all_of!r}",),
+        )
     else:
-        model_lines = _build_model_lines(name, schema)
+        _emit_model_lines(writer, name, schema, frozenset(schema.get("required") or ()), context)
 
-    state.rebuild_names.append(name)
-    return [*model_lines, ""]
+    writer.line()
 
 
-def _emit_root_model(name: str, schema: AnySchema, state: EmissionState) -> list[str]:
+def _emit_root_model(
+    writer: _LineWriter, name: str, schema: AnySchema, state: EmissionState
+) -> None:
     state.render_context.root_model_names.add(name)
     type_expr = schema_to_type_expr(schema, context=state.render_context)
-    state.rebuild_names.append(name)
-    return [
-        f"class {name}({root_model_annotation(type_expr)}):",
-        "    pass",
-        "",
-    ]
+    writer.line(f"class {name}({root_model_annotation(type_expr)}):")
+    writer.line("    pass")
+    writer.line()
 
 
-def _merge_allof_object_schema(all_of: list[Any]) -> tuple[list[str], dict[str, Any]]:
+def _merge_allof_object_schema(
+    all_of: list[Any],
+) -> tuple[list[str], dict[str, Any], frozenset[str]]:
     base_classes: list[str] = []
     inline_properties: dict[str, Any] = {}
     inline_required: list[str] = []
+    seen_required: set[str] = set()
     additional_properties: Any = None
 
     for part in all_of:
@@ -167,7 +281,8 @@ def _merge_allof_object_schema(all_of: list[Any]) -> tuple[list[str], dict[str,
             required = part.get("required")
             if isinstance(required, list):
                 for item in required:
-                    if item not in inline_required:
+                    if item not in seen_required:
+                        seen_required.add(item)
                         inline_required.append(item)
 
             additional = part.get("additionalProperties")
@@ -183,43 +298,39 @@ def _merge_allof_object_schema(all_of: list[Any]) -> tuple[list[str], dict[str,
     }
     if additional_properties is not None:
         merged_schema["additionalProperties"] = additional_properties
-    return base_classes, merged_schema
+    return base_classes, merged_schema, frozenset(seen_required)
 
 
-def _build_model_lines(
+def _emit_model_lines(
+    writer: _LineWriter,
     name: str,
     schema: AnySchema,
+    required: frozenset[str],
+    context: RenderContext,
     *,
     base_classes: list[str] | None = None,
-) -> list[str]:
-    properties = schema.get("properties") if isinstance(schema, dict) else None
-    required = set(schema.get("required", [])) if isinstance(schema, dict) else set()
-    additional = schema.get("additionalProperties") if isinstance(schema, dict) else None
+    class_attributes: tuple[str, ...] = (),
+) -> None:
+    properties = schema.get("properties")
+    additional = schema.get("additionalProperties")
 
-    bases = base_classes or ["BaseModel"]
-    lines = [f"class {name}({', '.join(bases)}):"]
+    bases = base_classes or _DEFAULT_BASES
 
-    alias_used = False
     field_lines: list[str] = []
-    used_names: set[str] = set()
+    alias_used = False
 
     if isinstance(properties, dict):
-        for prop_name, prop_schema in properties.items():
-            attr_name = _dedupe_name(_sanitize_identifier(prop_name), used_names)
-            alias = prop_name if attr_name != prop_name else None
-            if alias:
-                alias_used = True
-
-            type_expr = schema_to_type_expr(prop_schema)
-            is_required = prop_name in required
-            if is_required:
-                default_expr = f" = Field(alias={alias!r})" if alias else ""
-            else:
-                default_expr = (
-                    f" = Field(default=None, alias={alias!r})" if alias else " = None"
-                )
-
-            field_lines.append(f"    {attr_name}: {type_expr}{default_expr}")
+        used_names: set[str] = set()
+        attr_names = [_dedupe_name(_sanitize_identifier(prop), used_names) for prop in properties]
+        field_lines = [
+            _FIELD_TEMPLATES[prop_name in required, attr_name != prop_name].format(
+                attr_name, schema_to_type_expr(prop_schema, context=context), prop_name
+            )
+            for attr_name, (prop_name, prop_schema) in zip(attr_names, properties.items())
+        ]
+        alias_used = any(
+            attr_name != prop_name for attr_name, prop_name in zip(attr_names, properties)
+        )
 
     config_args: list[str] = []
     extra_line: str | None = None
@@ -232,37 +343,109 @@ def _build_model_lines(
         config_args.append("extra='allow'")
     elif isinstance(additional, dict):
         config_args.append("extra='allow'")
-        extra_type = schema_to_type_expr(additional)
+        extra_type = schema_to_type_expr(additional, context=context)
         extra_line = (
             f"    __pydantic_extra__: {extra_field_annotation(extra_type)} = Field(init=False)"
         )
 
+    writer.line(f"class {name}({', '.join(bases)}):")
+    writer.lines(class_attributes)
     if config_args:
-        lines.append(f"    model_config = ConfigDict({', '.join(config_args)})")
+        writer.line(f"    model_config = ConfigDict({', '.join(config_args)})")
     if extra_line:
-        lines.append(extra_line)
+        writer.line(extra_line)
+    writer.lines(field_lines)
+    if not (class_attributes or config_args or extra_line or field_lines):
+        writer.line("    pass")
+
+
+def _emit_model_rebuilds(writer: _LineWriter, names: list[str]) -> None:
+    if not names:
+        return
+    writer.lines(f"{name}.model_rebuild()" for name in names)
+    writer.line()
 
-    if field_lines:
-        lines.extend(field_lines)
-    elif len(lines) == 1:
-        lines.append("    pass")
 
-    return lines
+@dataclass(slots=True)
+class RouteEmit:
+    """Schema names and schemas of one route, computed once for every emission pass."""
 
+    path: str
+    method: str
+    request_parts: list[tuple[str, str, AnySchema]]
+    response_parts: list[tuple[str, str, AnySchema]]
 
-def _emit_model_rebuilds(names: list[str]) -> list[str]:
-    if not names:
-        return []
-    return [*(f"{name}.model_rebuild()" for name in names), ""]
 
+def _build_route_emits(routes: list[RouteInfo]) -> list[RouteEmit]:
+    route_emits: list[RouteEmit] = []
+    for route in routes:
+        names = generate_route_schema_names(route)
+        path_params: list[RouteParameter] = []
+        query_params: list[RouteParameter] = []
+        header_params: list[RouteParameter] = []
+        buckets = {"path": path_params, "query": query_params, "header": header_params}
+        for param in route.parameters:
+            bucket = buckets.get(param.location)
+            if bucket is not None:
+                bucket.append(param)
+
+        request_parts: list[tuple[str, str, AnySchema]] = []
+        if names.params_schema_name and path_params:
+            request_parts.append(
+                (
+                    "params",
+                    names.params_schema_name,
+                    _build_openapi_object_schema(
+                        [
+                            {"name": p.name, "schema": p.schema, "required": True}
+                            for p in path_params
+                        ]
+                    ),
+                )
+            )
+
+        if names.query_schema_name and query_params:
+            request_parts.append(
+                (
+                    "query",
+                    names.query_schema_name,
+                    _build_openapi_object_schema(
+                        [
+                            {"name": p.name, "schema": p.schema, "required": p.required}
+                            for p in query_params
+                        ]
+                    ),
+                )
+            )
+
+        if names.headers_schema_name and header_params:
+            request_parts.append(
+                (
+                    "headers",
+                    names.headers_schema_name,
+                    _build_openapi_object_schema(
+                        [
+                            {"name": p.name, "schema": p.schema, "required": p.required}
+                            for p in header_params
+                        ]
+                    ),
+                )
+            )
+
+        if names.body_schema_name and route.request_body is not None:
+            request_parts.append(("body", names.body_schema_name, route.request_body))
+
+        response_parts = list(route.iter_responses())
+
+        route_emits.append(RouteEmit(route.path, route.method, request_parts, response_parts))
+    return route_emits
 
-def _emit_route_schemas(
-    routes: list[RouteInfo],
+
+def _register_route_schemas(
+    route_emits: list[RouteEmit],
     lowering_context: LoweringContext,
-    registry: Any,
-    state: EmissionState,
-) -> tuple[list[str], dict[str, str]]:
-    lines: list[str] = []
+    registry: SchemaRegistry,
+) -> tuple[list[NamedSchema], dict[str, str]]:
     route_named_schemas: list[NamedSchema] = []
 
     schema_name_to_canonical: dict[str, str] = {}
@@ -279,97 +462,37 @@ def _emit_route_schemas(
                     NamedSchema(name=named_schema.name, schema=canonical_schema)
                 )
 
-    for common in find_common_schemas(_collect_route_schemas(routes), 2):
+    for common in find_common_schemas(
+        _collect_route_schemas(route_emits), 2, registry.fingerprints
+    ):
         if common.fingerprint in registry.fingerprint_to_name:
             continue
         register_named_schema_batch(
             lower_named_schema(lowering_context, common.name, common.schema)
         )
 
-    def register_route_schema(name: str, schema: AnySchema) -> None:
-        if _route_schema_ref_target(schema):
-            return
-        register_named_schema_batch(lower_named_schema(lowering_context, name, schema))
-
-    for route in routes:
-        names = generate_route_schema_names(route)
-        path_params = [p for p in route.parameters if p.location == "path"]
-        query_params = [p for p in route.parameters if p.location == "query"]
-        header_params = [p for p in route.parameters if p.location == "header"]
-
-        if names.params_schema_name and path_params:
-            register_route_schema(
-                names.params_schema_name,
-                _build_openapi_object_schema(
-                    [{"name": p.name, "schema": p.schema, "required": True} for p in path_params]
-                ),
-            )
-
-        if names.query_schema_name and query_params:
-            register_route_schema(
-                names.query_schema_name,
-                _build_openapi_object_schema(
-                    [
-                        {"name": p.name, "schema": p.schema, "required": p.required}
-                        for p in query_params
-                    ]
-                ),
-            )
-
-        if names.headers_schema_name and header_params:
-            register_route_schema(
-                names.headers_schema_name,
-                _build_openapi_object_schema(
-                    [
-                        {"name": p.name, "schema": p.schema, "required": p.required}
-                        for p in header_params
-                    ]
-                ),
-            )
-
-        if names.body_schema_name and route.request_body is not None:
-            register_route_schema(names.body_schema_name, route.request_body)
-
-        for status_code, response_schema in route.responses.items():
-            if not response_schema:
+    for route_emit in route_emits:
+        for _, name, schema in (*route_emit.request_parts, *route_emit.response_parts):
+            if _route_schema_ref_target(schema):
                 continue
-            suffix = "Response" if status_code.startswith("2") else "ErrorResponse"
-            register_route_schema(
-                build_route_schema_name(route.path, route.method, f"{status_code}{suffix}"),
-                response_schema,
-            )
-
-    for named_schema in route_named_schemas:
-        lines.extend(_emit_named_schema(named_schema.name, named_schema.schema, state))
+            register_named_schema_batch(lower_named_schema(lowering_context, name, schema))
 
-    return lines, schema_name_to_canonical
+    return route_named_schemas, schema_name_to_canonical
 
 
-def _collect_route_schemas(routes: list[RouteInfo]) -> list[DedupNamedSchema]:
-    collected: list[DedupNamedSchema] = []
-    for route in routes:
-        for status_code, response_schema in route.responses.items():
-            if not response_schema:
-                continue
-            suffix = "Response" if status_code.startswith("2") else "ErrorResponse"
-            collected.append(
-                {
-                    "name": build_route_schema_name(
-                        route.path,
-                        route.method,
-                        f"{status_code}{suffix}",
-                    ),
-                    "schema": response_schema,
-                }
-            )
-    return collected
+def _collect_route_schemas(route_emits: list[RouteEmit]) -> list[DedupNamedSchema]:
+    return [
+        {"name": name, "schema": schema}
+        for route_emit in route_emits
+        for _, name, schema in route_emit.response_parts
+    ]
 
 
 def _generate_request_response_objects(
-    routes: list[RouteInfo],
+    writer: _LineWriter,
+    route_emits: list[RouteEmit],
     schema_name_to_canonical: dict[str, str],
-) -> list[str]:
-    lines: list[str] = []
+) -> None:
     request_paths: dict[str, dict[str, list[tuple[str, str]]]] = {}
     response_paths: dict[str, dict[str, dict[str, str]]] = {}
 
@@ -379,87 +502,41 @@ def _generate_request_response_objects(
             return ref_target
         return schema_name_to_canonical.get(name, name)
 
-    for route in routes:
-        names = generate_route_schema_names(route)
-        path_params = [p for p in route.parameters if p.location == "path"]
-        query_params = [p for p in route.parameters if p.location == "query"]
-        header_params = [p for p in route.parameters if p.location == "header"]
-
-        request_paths.setdefault(route.path, {})
-        request_parts: list[tuple[str, str]] = []
-
-        if names.params_schema_name and path_params:
-            schema = _build_openapi_object_schema(
-                [{"name": p.name, "schema": p.schema, "required": True} for p in path_params]
-            )
-            request_parts.append(("params", resolve_schema_name(names.params_schema_name, schema)))
-
-        if names.query_schema_name and query_params:
-            schema = _build_openapi_object_schema(
-                [{"name": p.name, "schema": p.schema, "required": p.required} for p in query_params]
-            )
-            request_parts.append(("query", resolve_schema_name(names.query_schema_name, schema)))
-
-        if names.headers_schema_name and header_params:
-            schema = _build_openapi_object_schema(
-                [
-                    {"name": p.name, "schema": p.schema, "required": p.required}
-                    for p in header_params
-                ]
-            )
-            request_parts.append(
-                (
-                    "headers",
-                    resolve_schema_name(names.headers_schema_name, schema),
-                )
-            )
-
-        if names.body_schema_name and route.request_body is not None:
-            request_parts.append(
-                ("body", resolve_schema_name(names.body_schema_name, route.request_body))
-            )
-
-        if request_parts:
-            request_paths[route.path][route.method] = request_parts
+    for route_emit in route_emits:
+        request_methods = request_paths.setdefault(route_emit.path, {})
+        if route_emit.request_parts:
+            request_methods[route_emit.method] = [
+                (key, resolve_schema_name(name, schema))
+                for key, name, schema in route_emit.request_parts
+            ]
 
-        response_paths.setdefault(route.path, {})
-        response_paths[route.path].setdefault(route.method, {})
-        for status_code, response_schema in route.responses.items():
-            if not response_schema:
-                continue
-            suffix = "Response" if status_code.startswith("2") else "ErrorResponse"
-            schema_name = build_route_schema_name(
-                route.path,
-                route.method,
-                f"{status_code}{suffix}",
-            )
-            response_paths[route.path][route.method][status_code] = resolve_schema_name(
-                schema_name,
-                response_schema,
-            )
+        status_codes = response_paths.setdefault(route_emit.path, {}).setdefault(
+            route_emit.method, {}
+        )
+        for status_code, name, schema in route_emit.response_parts:
+            status_codes[status_code] = resolve_schema_name(name, schema)
 
-    lines.append("Request = {")
+    writer.line("Request = {")
     for path, methods in request_paths.items():
-        lines.append(f"    {path!r}: {{")
+        writer.line(f"    {path!r}: {{")
         for method, parts in methods.items():
-            lines.append(f"        {method!r}: {{")
+            writer.line(f"        {method!r}: {{")
             for key, model_name in parts:
-                lines.append(f"            {key!r}: {model_name},")
-            lines.append("        },")
-        lines.append("    },")
-    lines.append("}")
-    lines.append("")
-    lines.append("Response = {")
+                writer.line(f"            {key!r}: {model_name},")
+            writer.line("        },")
+        writer.line("    },")
+    writer.line("}")
+    writer.line()
+    writer.line("Response = {")
     for path, methods in response_paths.items():
-        lines.append(f"    {path!r}: {{")
+        writer.line(f"    {path!r}: {{")
         for method, status_codes in methods.items():
-            lines.append(f"        {method!r}: {{")
+            writer.line(f"        {method!r}: {{")
             for status_code, model_name in status_codes.items():
-                lines.append(f"            {status_code!r}: {model_name},")
-            lines.append("        },")
-        lines.append("    },")
-    lines.append("}")
-    return lines
+                writer.line(f"            {status_code!r}: {model_name},")
+            writer.line("        },")
+        writer.line("    },")
+    writer.line("}")
 
 
 def _build_openapi_object_schema(params: list[dict[str, Any]]) -> dict[str, Any]:
@@ -483,36 +560,50 @@ def _route_schema_ref_target(schema: AnySchema) -> str | None:
 
 
 def _rewrite_schema_refs(schema: AnySchema, aliases: dict[str, str]) -> AnySchema:
-    if not isinstance(schema, dict):
+    # Subtrees without aliased refs are returned as-is, so shared inline schemas keep
+    # their identity and their cached fingerprints.
+    if not isinstance(schema, dict) or not aliases:
         return schema
 
-    rewritten = dict(schema)
-    ref = rewritten.get("$ref")
+    updates: dict[str, Any] = {}
+    ref = schema.get("$ref")
     if isinstance(ref, str):
         name = decode_component_ref(ref)
         canonical = aliases.get(name)
         if canonical and canonical != name:
-            rewritten["$ref"] = f"#/components/schemas/{canonical}"
+            updates["$ref"] = f"#/components/schemas/{canonical}"
 
-    for key, value in list(rewritten.items()):
+    for key, value in schema.items():
         if isinstance(value, dict):
-            rewritten[key] = _rewrite_schema_refs(value, aliases)
+            rewritten_value = _rewrite_schema_refs(value, aliases)
+            if rewritten_value is not value:
+                updates[key] = rewritten_value
         elif isinstance(value, list):
-            rewritten[key] = [
+            rewritten_items = [
                 _rewrite_schema_refs(item, aliases) if isinstance(item, dict) else item
                 for item in value
             ]
+            if any(new is not old for new, old in zip(rewritten_items, value)):
+                updates[key] = rewritten_items
 
-    return rewritten
+    if not updates:
+        return schema
+    return {**schema, **updates}
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_identifier(name: str) -> str:
-    result = "".join(ch if ch in _VALID_IDENTIFIER_CHARS else "_" for ch in name)
+    if name.isascii() and name.isidentifier():
+        result = name
+    else:
+        result = name.translate(_ASCII_IDENTIFIER_TRANSLATION)
+        if not result.isascii():
+            result = _NON_IDENTIFIER_CHAR.sub("_", result)
     if result and result[0].isupper() and result[1:].islower():
         result = result[0].lower() + result[1:]
     if not result or result[0].isdigit():
         result = f"_{result}"
-    return f"{result}_" if result in {"class", "from", "global", "pass"} else result
+    return sys.intern(f"{result}_" if keyword.iskeyword(result) else result)
 
 
 def _dedupe_name(name: str, used: set[str]) -> str:
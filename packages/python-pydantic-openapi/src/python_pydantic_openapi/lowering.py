@@ -17,18 +17,22 @@ class NamedSchema:
 @dataclass(slots=True)
 class LoweringContext:
     used_names: set[str] = field(default_factory=set)
+    # Last suffix handed out per base name; names are never released, so earlier
+    # suffixes stay taken and the search can resume from here.
+    next_suffix: dict[str, int] = field(default_factory=dict)
 
     def reserve_name(self, base_name: str) -> str:
         if base_name not in self.used_names:
             self.used_names.add(base_name)
             return base_name
 
-        index = 2
+        index = self.next_suffix.get(base_name, 2)
         while f"{base_name}_{index}" in self.used_names:
             index += 1
 
         reserved = f"{base_name}_{index}"
         self.used_names.add(reserved)
+        self.next_suffix[base_name] = index + 1
         return reserved
 
 
@@ -37,6 +41,8 @@ def lower_named_schema(
     name: str,
     schema: AnySchema,
 ) -> list[NamedSchema]:
+    if not isinstance(schema, dict):
+        return [NamedSchema(name=name, schema=schema)]
     lowered, hoisted = _lower_schema(context, name, schema)
     return [*hoisted, NamedSchema(name=name, schema=lowered)]
 
@@ -46,55 +52,63 @@ def _lower_schema(
     parent_name: str,
     schema: AnySchema,
 ) -> tuple[AnySchema, list[NamedSchema]]:
-    if not isinstance(schema, dict):
-        return schema, []
-
-    lowered = dict(schema)
     hoisted: list[NamedSchema] = []
+    # Only keys whose children were lowered are copied, so schemas without
+    # nested models are returned as-is.
+    updates: dict[str, Any] = {}
 
-    properties = lowered.get("properties")
+    properties = schema.get("properties")
     if isinstance(properties, dict):
         lowered_properties: dict[str, AnySchema] = {}
         for prop_name, prop_schema in properties.items():
             child_name = f"{parent_name}{to_pascal_case(prop_name)}"
             lowered_child, child_hoisted = _lower_child_schema(context, child_name, prop_schema)
-            lowered_properties[prop_name] = lowered_child
+            if lowered_child is not prop_schema:
+                lowered_properties[prop_name] = lowered_child
             hoisted.extend(child_hoisted)
-        lowered["properties"] = lowered_properties
+        if lowered_properties:
+            updates["properties"] = {**properties, **lowered_properties}
 
-    items = lowered.get("items")
+    items = schema.get("items")
     if isinstance(items, dict):
         lowered_items, item_hoisted = _lower_child_schema(
             context,
             f"{parent_name}Item",
             items,
         )
-        lowered["items"] = lowered_items
+        if lowered_items is not items:
+            updates["items"] = lowered_items
         hoisted.extend(item_hoisted)
 
-    additional = lowered.get("additionalProperties")
+    additional = schema.get("additionalProperties")
     if isinstance(additional, dict):
         lowered_additional, additional_hoisted = _lower_child_schema(
             context,
             f"{parent_name}Value",
             additional,
         )
-        lowered["additionalProperties"] = lowered_additional
+        if lowered_additional is not additional:
+            updates["additionalProperties"] = lowered_additional
         hoisted.extend(additional_hoisted)
 
     for keyword, suffix in (("oneOf", "Option"), ("anyOf", "Option"), ("allOf", "Part")):
-        value = lowered.get(keyword)
+        value = schema.get(keyword)
         if not isinstance(value, list):
             continue
         lowered_items_list: list[AnySchema] = []
+        changed = False
         for index, item in enumerate(value, start=1):
             child_name = f"{parent_name}{suffix}{index}"
             lowered_item, item_hoisted = _lower_child_schema(context, child_name, item)
             lowered_items_list.append(lowered_item)
+            changed = changed or lowered_item is not item
             hoisted.extend(item_hoisted)
-        lowered[keyword] = lowered_items_list
+        if changed:
+            updates[keyword] = lowered_items_list
 
-    return lowered, hoisted
+    if not updates:
+        return schema, hoisted
+    return {**schema, **updates}, hoisted
 
 
 def _lower_child_schema(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeAlias, TypedDict, cast
 
 SUPPORTED_STRING_FORMATS = [
     "color-hex",
@@ -14,6 +14,8 @@ SUPPORTED_STRING_FORMATS = [
     "url",
     "uuid",
 ]
+_SUPPORTED_STRING_FORMATS_SET = frozenset(SUPPORTED_STRING_FORMATS)
+_PRIMITIVE_REGISTRATION_TYPES = frozenset({"number", "integer", "boolean"})
 
 SupportedStringFormat = Literal[
     "color-hex",
@@ -63,9 +65,32 @@ class PydanticSchemaRegistry:
     def __init__(self) -> None:
         self._string_format_to_name: dict[str, str] = {}
         self._primitive_type_to_name: dict[str, str] = {}
-        self._schema_ids: dict[int, PydanticOpenApiRegistration] = {}
+        # Keyed by ``id(schema)`` with the schema kept alive alongside, so a recycled id
+        # never matches.
+        self._schema_ids: dict[int, tuple[Any, PydanticOpenApiRegistration]] = {}
+        self._change_listeners: list[Callable[[], None]] = []
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        for listener in self._change_listeners:
+            listener()
 
     def register(self, schema: Any, registration: PydanticOpenApiRegistration) -> None:
+        existing_entry = self._schema_ids.get(id(schema))
+        if (
+            existing_entry is not None
+            and existing_entry[0] is schema
+            and existing_entry[1] == registration
+        ):
+            # Re-registering the same schema is a no-op; skip validation and cache resets.
+            return
+
+        self._notify_change()
+        # Store a copy: a caller that mutates its dict and registers again must not
+        # find its own (already mutated) dict and be treated as a repeat.
+        entry = (schema, cast(PydanticOpenApiRegistration, dict(registration)))
         reg_type = registration["type"]
         registration_dict = cast(dict[str, Any], registration)
 
@@ -73,7 +98,7 @@ class PydanticSchemaRegistry:
             format_value = registration_dict.get("format")
             if isinstance(format_value, str):
                 self._register_string_format(format_value, registration)
-                self._schema_ids[id(schema)] = registration
+                self._schema_ids[id(schema)] = entry
                 return
 
             format_values = registration_dict.get("formats")
@@ -81,10 +106,10 @@ class PydanticSchemaRegistry:
                 for format_item in format_values:
                     if isinstance(format_item, str):
                         self._register_string_format(format_item, registration)
-                self._schema_ids[id(schema)] = registration
+                self._schema_ids[id(schema)] = entry
                 return
 
-        if reg_type in {"number", "integer", "boolean"}:
+        if reg_type in _PRIMITIVE_REGISTRATION_TYPES:
             name = registration["schema_exported_variable_name"]
             existing = self._primitive_type_to_name.get(reg_type)
             if existing and existing != name:
@@ -92,7 +117,7 @@ class PydanticSchemaRegistry:
                     f"duplicate Pydantic OpenAPI registration for type '{reg_type}'",
                 )
             self._primitive_type_to_name[reg_type] = name
-            self._schema_ids[id(schema)] = registration
+            self._schema_ids[id(schema)] = entry
             return
 
         raise ValueError("unsupported registration type")
@@ -102,7 +127,7 @@ class PydanticSchemaRegistry:
         fmt: SupportedStringFormat | str,
         registration: PydanticOpenApiRegistration,
     ) -> None:
-        if fmt not in SUPPORTED_STRING_FORMATS:
+        if fmt not in _SUPPORTED_STRING_FORMATS_SET:
             raise ValueError(f"unsupported string format registration: {fmt!r}")
         name = registration["schema_exported_variable_name"]
         existing = self._string_format_to_name.get(fmt)
@@ -113,6 +138,10 @@ class PydanticSchemaRegistry:
         self._string_format_to_name[fmt] = name
 
     def clear(self) -> None:
+        if not (self._string_format_to_name or self._primitive_type_to_name or self._schema_ids):
+            # Already empty: nothing rendered against this registry is stale.
+            return
+        self._notify_change()
         self._string_format_to_name.clear()
         self._primitive_type_to_name.clear()
         self._schema_ids.clear()
@@ -120,8 +149,7 @@ class PydanticSchemaRegistry:
     def get_schema_exported_variable_name_for_string_format(
         self, format_value: SupportedStringFormat | str
     ) -> str | None:
-        if format_value not in SUPPORTED_STRING_FORMATS:
-            return None
+        # Only supported formats are ever stored, so no separate membership check is needed.
         return self._string_format_to_name.get(format_value)
 
     def get_schema_exported_variable_name_for_primitive_type(
@@ -130,7 +158,8 @@ class PydanticSchemaRegistry:
         return self._primitive_type_to_name.get(type_value)
 
     def is_registered(self, schema: Any) -> bool:
-        return id(schema) in self._schema_ids
+        entry = self._schema_ids.get(id(schema))
+        return entry is not None and entry[0] is schema
 
 
 schema_registry = PydanticSchemaRegistry()
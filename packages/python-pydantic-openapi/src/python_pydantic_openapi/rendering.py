@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache, partial
+from typing import Any, Callable
 from urllib.parse import unquote
 
 from .registry import (
     get_schema_exported_variable_name_for_primitive_type,
     get_schema_exported_variable_name_for_string_format,
 )
-from .type_render import format_openapi_metadata
+from .schema_dedup import FingerprintCache, get_schema_fingerprint
+from .type_render import format_literal, format_openapi_metadata
 from .types import AnySchema
 from .types.array import convert_openapi_array_to_pydantic
 from .types.boolean import convert_openapi_boolean_to_pydantic
@@ -18,15 +21,32 @@ from .types.object import convert_openapi_object_to_pydantic
 from .types.string import convert_openapi_string_to_pydantic
 from .types.union import convert_openapi_union_to_pydantic
 
+_ConvertChild = Callable[[dict[str, Any]], str]
+_SchemaHandler = Callable[[dict[str, Any], _ConvertChild], str]
+
 
 @dataclass(slots=True)
 class RenderContext:
     root_model_names: set[str] = field(default_factory=set)
+    # Rendered expressions keyed by schema fingerprint, so structurally identical
+    # schemas passed to schema_to_type_expr with this context render once.
+    type_exprs: dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+    fingerprints: FingerprintCache = field(default_factory=dict, repr=False, compare=False)
+    # Bound once per context and handed to every converter, rather than rebuilt per node.
+    # A partial calls straight into _schema_to_type_expr without an extra Python frame.
+    convert_child: _ConvertChild = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.convert_child = partial(_schema_to_type_expr, context=self)
+
 
+_COMPONENT_REF_PREFIX = "#/components/schemas/"
 
+
+@lru_cache(maxsize=4096)
 def decode_component_ref(ref: str) -> str:
-    if ref.startswith("#/components/schemas/"):
-        return unquote(ref.split("#/components/schemas/")[1])
+    if ref.startswith(_COMPONENT_REF_PREFIX):
+        return sys.intern(unquote(ref[len(_COMPONENT_REF_PREFIX) :]))
     return ref
 
 
@@ -69,84 +89,97 @@ def needs_named_model(schema: AnySchema) -> bool:
     return is_object_model_schema(schema)
 
 
+def _render_string(schema: dict[str, Any], convert_child: _ConvertChild) -> str:
+    return convert_openapi_string_to_pydantic(schema)
+
+
+def _render_number(schema: dict[str, Any], convert_child: _ConvertChild) -> str:
+    return convert_openapi_number_to_pydantic(schema)
+
+
+def _render_boolean(schema: dict[str, Any], convert_child: _ConvertChild) -> str:
+    return convert_openapi_boolean_to_pydantic(schema)
+
+
+_TYPE_HANDLERS: dict[str, _SchemaHandler] = {
+    "string": _render_string,
+    "number": _render_number,
+    "integer": _render_number,
+    "boolean": _render_boolean,
+    "array": convert_openapi_array_to_pydantic,
+    "object": convert_openapi_object_to_pydantic,
+}
+
+
+def _render_any_of(schema: dict[str, Any], convert_child: _ConvertChild) -> str:
+    return convert_openapi_union_to_pydantic(
+        {"oneOf": schema["anyOf"], "discriminator": schema.get("discriminator")},
+        convert_child,
+    )
+
+
+# Checked in order before the type dispatch; the first list-valued keyword wins.
+_COMPOSITION_HANDLERS: tuple[tuple[str, _SchemaHandler], ...] = (
+    ("oneOf", convert_openapi_union_to_pydantic),
+    ("anyOf", _render_any_of),
+    ("allOf", convert_openapi_intersection_to_pydantic),
+)
+
+_PRIMITIVE_TYPES = frozenset({"number", "integer", "boolean"})
+
+
 def schema_to_type_expr(
     schema: AnySchema | None,
     *,
     context: RenderContext | None = None,
 ) -> str:
+    if context is None or not isinstance(schema, dict):
+        return _schema_to_type_expr(schema, context=context or RenderContext())
+
+    # Only the entry point is fingerprinted; nested schemas render through
+    # convert_child without re-serializing each subtree.
+    fingerprint = get_schema_fingerprint(schema, context.fingerprints)
+    expr = context.type_exprs.get(fingerprint)
+    if expr is None:
+        expr = context.type_exprs[fingerprint] = _schema_to_type_expr(schema, context=context)
+    return expr
+
+
+def _schema_to_type_expr(schema: AnySchema | None, *, context: RenderContext) -> str:
     if not isinstance(schema, dict):
         return "Any"
+    expr = _render_type_expr(schema, context)
+    if schema.get("nullable") is True:
+        expr = f"Optional[{expr}]"
+    return expr
 
-    render_context = context or RenderContext()
+
+def _render_type_expr(schema: dict[str, Any], render_context: RenderContext) -> str:
+    """Render ``schema`` without its nullable wrapper, which the caller applies."""
+    convert_child = render_context.convert_child
 
     if isinstance(schema.get("$ref"), str):
         ref = schema["$ref"]
-        if not ref.startswith("#/components/schemas/"):
-            return wrap_nullable("Any", schema)
-        expr = decode_component_ref(ref)
-        return wrap_nullable(expr, schema)
-
-    if isinstance(schema.get("oneOf"), list):
-        expr = convert_openapi_union_to_pydantic(
-            schema,
-            lambda child: schema_to_type_expr(child, context=render_context),
-        )
-        return wrap_nullable(expr, schema)
-
-    if isinstance(schema.get("anyOf"), list):
-        expr = convert_openapi_union_to_pydantic(
-            {"oneOf": schema["anyOf"], "discriminator": schema.get("discriminator")},
-            lambda child: schema_to_type_expr(child, context=render_context),
-        )
-        return wrap_nullable(expr, schema)
-
-    if isinstance(schema.get("allOf"), list):
-        expr = convert_openapi_intersection_to_pydantic(
-            schema,
-            lambda child: schema_to_type_expr(child, context=render_context),
-        )
-        return wrap_nullable(expr, schema)
-
-    schema_type = schema.get("type")
-
-    if schema_type == "string":
-        expr = convert_openapi_string_to_pydantic(schema)
-        return wrap_nullable(expr, schema)
+        if not ref.startswith(_COMPONENT_REF_PREFIX):
+            return "Any"
+        return decode_component_ref(ref)
 
-    if schema_type in {"number", "integer"}:
-        expr = convert_openapi_number_to_pydantic(schema)
-        return wrap_nullable(expr, schema)
+    for keyword, composition_handler in _COMPOSITION_HANDLERS:
+        if isinstance(schema.get(keyword), list):
+            return composition_handler(schema, convert_child)
 
-    if schema_type == "boolean":
-        expr = convert_openapi_boolean_to_pydantic(schema)
-        return wrap_nullable(expr, schema)
-
-    if schema_type == "array":
-        expr = convert_openapi_array_to_pydantic(
-            schema,
-            lambda child: schema_to_type_expr(child, context=render_context),
-        )
-        return wrap_nullable(expr, schema)
+    schema_type = schema.get("type")
+    handler = _TYPE_HANDLERS.get(schema_type) if isinstance(schema_type, str) else None
+    if handler is None and "properties" in schema:
+        handler = convert_openapi_object_to_pydantic
 
-    if schema_type == "object" or "properties" in schema:
-        expr = convert_openapi_object_to_pydantic(
-            schema,
-            lambda child: schema_to_type_expr(child, context=render_context),
-        )
-        return wrap_nullable(expr, schema)
+    if handler is not None:
+        return handler(schema, convert_child)
 
     if isinstance(schema.get("enum"), list):
-        values = ", ".join(repr(value) for value in schema["enum"])
-        expr = f"Literal[{values}]"
-        return wrap_nullable(expr, schema)
+        return format_literal(schema["enum"])
 
-    return wrap_nullable("Any", schema)
-
-
-def wrap_nullable(expr: str, schema: dict[str, Any]) -> str:
-    if schema.get("nullable") is True:
-        return f"Optional[{expr}]"
-    return expr
+    return "Any"
 
 
 def registered_output_alias(schema: AnySchema, context: RenderContext | None = None) -> str | None:
@@ -159,7 +192,7 @@ def registered_output_alias(schema: AnySchema, context: RenderContext | None = N
             return custom
 
     primitive_type = schema.get("type")
-    if primitive_type in {"number", "integer", "boolean"}:
+    if primitive_type in _PRIMITIVE_TYPES:
         custom = get_schema_exported_variable_name_for_primitive_type(primitive_type)
         if custom:
             return custom
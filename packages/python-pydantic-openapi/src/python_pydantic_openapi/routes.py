@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any, cast
 
 from .types import AnySchema
+from .utils import to_capitalized_pascal_case
 
 HttpMethod = str
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteParameter:
     name: str
     location: str
@@ -16,7 +19,7 @@ class RouteParameter:
     schema: AnySchema
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteInfo:
     path: str
     method: HttpMethod
@@ -24,6 +27,18 @@ class RouteInfo:
     request_body: AnySchema | None
     responses: dict[str, AnySchema]
 
+    def iter_responses(self) -> Iterator[tuple[str, str, AnySchema]]:
+        """Yield ``(status_code, schema_name, schema)`` for each response with a schema."""
+        for status_code, schema in self.responses.items():
+            if not schema:
+                continue
+            suffix = "Response" if status_code[:1] == "2" else "ErrorResponse"
+            yield (
+                status_code,
+                build_route_schema_name(self.path, self.method, f"{status_code}{suffix}"),
+                schema,
+            )
+
 
 @dataclass
 class RouteSchemaNames:
@@ -34,16 +49,25 @@ class RouteSchemaNames:
     response_schema_name: str | None = None
 
 
+_HTTP_METHODS = ("get", "post", "put", "patch", "delete", "head", "options")
+_UPPER_HTTP_METHODS = frozenset(method.upper() for method in _HTTP_METHODS)
+
+
 def _to_upper_method(method: str) -> HttpMethod:
     upper = method.upper()
-    if upper in {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}:
+    if upper in _UPPER_HTTP_METHODS:
         return upper
     return "GET"
 
 
-def _to_pascal_case(value: str) -> str:
-    parts = [part for part in "".join(c if c.isalnum() else " " for c in value).split()]
-    return "".join(part[:1].upper() + part[1:].lower() for part in parts)
+def _json_media_type(container: dict[str, Any]) -> dict[str, Any] | None:
+    content = container.get("content")
+    if not isinstance(content, dict):
+        return None
+    json_content = content.get("application/json")
+    if not isinstance(json_content, dict):
+        return None
+    return json_content
 
 
 def build_route_schema_name(path: str, method: HttpMethod, suffix: str) -> str:
@@ -55,9 +79,9 @@ def build_route_schema_name(path: str, method: HttpMethod, suffix: str) -> str:
             path_parts.append(part[1:-1])
         else:
             path_parts.append(part)
-    path_parts = [_to_pascal_case(part) for part in path_parts]
+    path_parts = [to_capitalized_pascal_case(part) for part in path_parts]
     method_prefix = method[:1] + method[1:].lower()
-    return "".join([method_prefix, *path_parts, suffix])
+    return sys.intern("".join([method_prefix, *path_parts, suffix]))
 
 
 def parse_openapi_paths(openapi: dict[str, Any]) -> list[RouteInfo]:
@@ -67,56 +91,51 @@ def parse_openapi_paths(openapi: dict[str, Any]) -> list[RouteInfo]:
     paths = cast(dict[str, Any], paths_obj)
 
     routes: list[RouteInfo] = []
-    methods = ["get", "post", "put", "patch", "delete", "head", "options"]
 
     for path, path_item_obj in paths.items():
         if not isinstance(path_item_obj, dict):
             continue
         path_item = cast(dict[str, Any], path_item_obj)
+        shared_params = path_item.get("parameters")
 
-        for method in methods:
+        for method in _HTTP_METHODS:
             operation_obj = path_item.get(method)
             if not isinstance(operation_obj, dict):
                 continue
             operation = cast(dict[str, Any], operation_obj)
 
-            parameters: list[RouteParameter] = []
-            responses: dict[str, AnySchema] = {}
-
-            for params_src in (path_item.get("parameters"), operation.get("parameters")):
-                if isinstance(params_src, list):
-                    for param in params_src:
-                        if isinstance(param, dict):
-                            parameters.append(
-                                RouteParameter(
-                                    name=str(param.get("name", "")),
-                                    location=str(param.get("in", "query")),
-                                    required=bool(param.get("required")),
-                                    schema=param.get("schema", {}),
-                                )
-                            )
+            parameters = [
+                RouteParameter(
+                    name=str(param.get("name", "")),
+                    location=str(param.get("in", "query")),
+                    required=bool(param.get("required")),
+                    schema=param.get("schema", {}),
+                )
+                for params_src in (shared_params, operation.get("parameters"))
+                if isinstance(params_src, list)
+                for param in params_src
+                if isinstance(param, dict)
+            ]
 
             request_body = None
             rb = operation.get("requestBody")
             if isinstance(rb, dict):
-                content = rb.get("content")
-                if isinstance(content, dict):
-                    json_content = content.get("application/json")
-                    if isinstance(json_content, dict):
-                        request_body = json_content.get("schema", {})
+                json_content = _json_media_type(rb)
+                if json_content is not None:
+                    request_body = json_content.get("schema", {})
 
+            responses: dict[str, AnySchema] = {}
             responses_obj = operation.get("responses")
             if isinstance(responses_obj, dict):
                 for status_code, response in responses_obj.items():
                     if not isinstance(response, dict):
                         continue
-                    content = response.get("content")
-                    if isinstance(content, dict):
-                        json_content = content.get("application/json")
-                        if isinstance(json_content, dict):
-                            schema = json_content.get("schema")
-                            if schema is not None:
-                                responses[str(status_code)] = schema
+                    json_content = _json_media_type(response)
+                    if json_content is None:
+                        continue
+                    schema = json_content.get("schema")
+                    if schema is not None:
+                        responses[str(status_code)] = schema
 
             routes.append(
                 RouteInfo(
@@ -132,34 +151,40 @@ def parse_openapi_paths(openapi: dict[str, Any]) -> list[RouteInfo]:
 
 
 def generate_route_schema_names(route: RouteInfo) -> RouteSchemaNames:
-    path_params = [p for p in route.parameters if p.location == "path"]
-    query_params = [p for p in route.parameters if p.location == "query"]
-    header_params = [p for p in route.parameters if p.location == "header"]
-    success_statuses = [status for status in route.responses if status.startswith("2")]
+    has_path = has_query = has_header = False
+    for param in route.parameters:
+        location = param.location
+        if location == "path":
+            has_path = True
+        elif location == "query":
+            has_query = True
+        elif location == "header":
+            has_header = True
+    has_success = any(status[:1] == "2" for status in route.responses)
 
     result = RouteSchemaNames()
-    if success_statuses:
+    if has_success:
         result.response_schema_name = build_route_schema_name(
             route.path,
             route.method,
             "Response",
         )
 
-    if path_params:
+    if has_path:
         result.params_schema_name = build_route_schema_name(
             route.path,
             route.method,
             "Params",
         )
 
-    if query_params:
+    if has_query:
         result.query_schema_name = build_route_schema_name(
             route.path,
             route.method,
             "Query",
         )
 
-    if header_params:
+    if has_header:
         result.headers_schema_name = build_route_schema_name(
             route.path,
             route.method,
@@ -1,30 +1,98 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import Any, TypedDict
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Any, NoReturn, TypedDict
 
 from .types import AnySchema
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-def _sort_object_deep(obj: Any) -> Any:
-    if obj is None or not isinstance(obj, (dict, list)):
-        return obj
-    if isinstance(obj, list):
-        return [_sort_object_deep(item) for item in obj]
-    sorted_obj: dict[str, Any] = {}
-    for key in sorted(obj.keys()):
-        sorted_obj[key] = _sort_object_deep(obj[key])
-    return sorted_obj
 
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
 
-def get_schema_fingerprint(schema: AnySchema) -> str:
-    return json.dumps(_sort_object_deep(schema), sort_keys=True)
+
+def _reject(value: object) -> NoReturn:
+    raise TypeError(f"schema is not JSON data: {type(value).__name__}")
+
+
+def _canonical_json(schema: AnySchema) -> bytes:
+    """Serialize ``schema`` with sorted keys; anything but JSON data raises TypeError.
+
+    The stdlib path decides what is accepted, and an orjson encoding is only used when it
+    decodes back to ``schema``, so both paths accept exactly the same inputs. The bytes
+    themselves differ between the paths (float and non-ASCII formatting).
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(schema, default=_reject, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # orjson also writes UUIDs and enums, and turns NaN into null.
+            if orjson.loads(encoded) == schema:
+                return encoded
+    try:
+        text = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=_reject)
+    except (TypeError, ValueError) as exc:
+        raise TypeError(f"schema is not JSON data: {exc}") from exc
+    _check_string_keys(schema)
+    return text.encode()
+
+
+def _check_string_keys(schema: AnySchema) -> None:
+    # json.dumps writes {1: ...} exactly like {"1": ...}; orjson rejects non-string keys.
+    stack: list[Any] = [schema]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"schema is not JSON data: {type(key).__name__} key")
+                if isinstance(item, (dict, list, tuple)):
+                    stack.append(item)
+        else:
+            stack.extend(item for item in value if isinstance(item, (dict, list, tuple)))
+
+
+# Per-run memo keyed by ``id(schema)``; the schema itself is kept alongside the
+# fingerprint so the id cannot be recycled by another object while the entry is alive.
+FingerprintCache = dict[int, tuple[AnySchema, str]]
+
+
+def get_schema_fingerprint(schema: AnySchema, cache: FingerprintCache | None = None) -> str:
+    """Digest ``schema``'s JSON content; only comparable with fingerprints from the same process.
+
+    Whether the optional orjson speedup is installed changes the digest, so fingerprints
+    must not be persisted or compared across processes.
+    """
+    if cache is None:
+        return blake2b(_canonical_json(schema), digest_size=16).hexdigest()
+    cached = cache.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    fingerprint = blake2b(_canonical_json(schema), digest_size=16).hexdigest()
+    cache[id(schema)] = (schema, fingerprint)
+    return fingerprint
 
 
 @dataclass
 class SchemaRegistry:
     fingerprint_to_name: dict[str, str]
+    # Lives as long as the registry, i.e. one codegen run; schemas must not be
+    # mutated while it is in use.
+    fingerprints: FingerprintCache = field(default_factory=dict)
 
 
 def create_schema_registry() -> SchemaRegistry:
@@ -42,7 +110,7 @@ def register_schema(
     name: str,
     schema: AnySchema,
 ) -> RegisterSchemaResult:
-    fingerprint = get_schema_fingerprint(schema)
+    fingerprint = get_schema_fingerprint(schema, registry.fingerprints)
     existing = registry.fingerprint_to_name.get(fingerprint)
     if existing:
         return RegisterSchemaResult(is_new=False, canonical_name=existing)
@@ -98,32 +166,40 @@ class NamedSchema(TypedDict):
     schema: AnySchema
 
 
+@dataclass(slots=True)
+class _SchemaBucket:
+    schema: AnySchema
+    names: list[str]
+    error_code: str | None
+
+
 def find_common_schemas(
     schemas: list[NamedSchema],
     min_count: int = 2,
+    cache: FingerprintCache | None = None,
 ) -> list[CommonSchema]:
-    fingerprints: dict[str, dict[str, Any]] = {}
+    buckets: dict[str, _SchemaBucket] = {}
 
     for item in schemas:
         name = item["name"]
         schema = item["schema"]
-        fingerprint = get_schema_fingerprint(schema)
-        existing = fingerprints.get(fingerprint)
-        if existing:
-            existing["names"].append(name)
+        fingerprint = get_schema_fingerprint(schema, cache)
+        existing = buckets.get(fingerprint)
+        if existing is not None:
+            existing.names.append(name)
         else:
-            fingerprints[fingerprint] = {
-                "schema": schema,
-                "names": [name],
-                "error_code": extract_error_code(schema),
-            }
+            buckets[fingerprint] = _SchemaBucket(
+                schema=schema,
+                names=[name],
+                error_code=extract_error_code(schema),
+            )
 
     common: list[CommonSchema] = []
-    for fingerprint, data in fingerprints.items():
-        names = data["names"]
+    for fingerprint, bucket in buckets.items():
+        names = bucket.names
         if len(names) < min_count:
             continue
-        error_code = data["error_code"]
+        error_code = bucket.error_code
         name = (
             generate_common_error_schema_name(error_code)
             if isinstance(error_code, str)
@@ -132,7 +208,7 @@ def find_common_schemas(
         common.append(
             CommonSchema(
                 name=name,
-                schema=data["schema"],
+                schema=bucket.schema,
                 fingerprint=fingerprint,
                 count=len(names),
             )
@@ -1,11 +1,54 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
 def format_openapi_metadata(meta: dict[str, Any]) -> str:
-    ordered = {key: meta[key] for key in sorted(meta)}
-    return f"json_schema_extra={{'openapi': {ordered!r}}}"
+    # Value types are part of the cache key so that e.g. 1 and 1.0 render separately.
+    return format_openapi_metadata_items(
+        tuple((key, type(meta[key]), meta[key]) for key in sorted(meta))
+    )
+
+
+def format_openapi_metadata_items(typed_items: tuple[tuple[str, type, Any], ...]) -> str:
+    """Render ``(key, type, value)`` items that are already in key order."""
+    try:
+        hash(typed_items)
+    except TypeError:
+        # Unhashable values (such as discriminator mappings) bypass the cache.
+        return _render_openapi_metadata(typed_items)
+    return _format_typed_openapi_metadata(typed_items)
+
+
+@lru_cache(maxsize=4096)
+def _format_typed_openapi_metadata(typed_items: tuple[tuple[str, type, Any], ...]) -> str:
+    return _render_openapi_metadata(typed_items)
+
+
+def _render_openapi_metadata(typed_items: tuple[tuple[str, type, Any], ...]) -> str:
+    # Same text as repr() of the dict, without building the dict first.
+    body = ", ".join(f"{key!r}: {value!r}" for key, _, value in typed_items)
+    return f"json_schema_extra={{'openapi': {{{body}}}}}"
+
+
+def format_literal(values: list[Any]) -> str:
+    typed_values = tuple((type(value), value) for value in values)
+    try:
+        hash(typed_values)
+    except TypeError:
+        # Unhashable enum values (such as objects) bypass the cache.
+        return _render_literal(typed_values)
+    return _format_typed_literal(typed_values)
+
+
+@lru_cache(maxsize=2048)
+def _format_typed_literal(typed_values: tuple[tuple[type, Any], ...]) -> str:
+    return _render_literal(typed_values)
+
+
+def _render_literal(typed_values: tuple[tuple[type, Any], ...]) -> str:
+    return f"Literal[{', '.join(repr(value) for _, value in typed_values)}]"
 
 
 def wrap_annotated(base: str, metadata: list[str]) -> str:
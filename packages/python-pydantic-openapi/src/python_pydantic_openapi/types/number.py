@@ -3,13 +3,15 @@ from __future__ import annotations
 from typing import Any
 
 from ..registry import get_schema_exported_variable_name_for_primitive_type
-from ..type_render import format_openapi_metadata, wrap_annotated
+from ..type_render import format_literal, format_openapi_metadata_items, wrap_annotated
+
+# Unconstrained expressions, rendered once.
+_STRICT_BASES = {base: wrap_annotated(base, ["Field(strict=True)"]) for base in ("int", "float")}
 
 
 def convert_openapi_number_to_pydantic(schema: dict[str, Any]) -> str:
     if isinstance(schema.get("enum"), list):
-        values = ", ".join(repr(value) for value in schema["enum"])
-        return f"Literal[{values}]"
+        return format_literal(schema["enum"])
 
     schema_type = schema.get("type")
     if schema_type in {"number", "integer", "boolean"}:
@@ -21,6 +23,8 @@ def convert_openapi_number_to_pydantic(schema: dict[str, Any]) -> str:
 
     minimum = schema.get("minimum")
     maximum = schema.get("maximum")
+    if not isinstance(minimum, (int, float)) and not isinstance(maximum, (int, float)):
+        return _STRICT_BASES[base]
 
     field_args: list[str] = ["strict=True"]
     if isinstance(minimum, (int, float)):
@@ -28,12 +32,13 @@ def convert_openapi_number_to_pydantic(schema: dict[str, Any]) -> str:
     if isinstance(maximum, (int, float)):
         field_args.append(f"le={maximum}")
 
-    meta: dict[str, Any] = {}
-    if isinstance(minimum, (int, float)):
-        meta["minimum"] = minimum
+    # Collected in key order, so the metadata is rendered without sorting.
+    meta: list[tuple[str, type, Any]] = []
     if isinstance(maximum, (int, float)):
-        meta["maximum"] = maximum
+        meta.append(("maximum", type(maximum), maximum))
+    if isinstance(minimum, (int, float)):
+        meta.append(("minimum", type(minimum), minimum))
     if meta:
-        field_args.append(format_openapi_metadata(meta))
+        field_args.append(format_openapi_metadata_items(tuple(meta)))
 
     return wrap_annotated(base, [f"Field({', '.join(field_args)})"])
@@ -1,17 +1,53 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from ..registry import get_schema_exported_variable_name_for_string_format
-from ..type_render import format_openapi_metadata, wrap_annotated
+from ..registry import get_schema_exported_variable_name_for_string_format, schema_registry
+from ..type_render import format_literal, format_openapi_metadata_items, wrap_annotated
+
+_COLOR_HEX_PATTERN = "^[a-fA-F0-9]{6}$"
+
+# Format -> (base type, pre-rendered default pattern argument); unlisted formats are
+# plain strings.
+_FORMAT_HANDLERS: dict[str, tuple[str, str | None]] = {
+    "email": ("EmailStr", None),
+    "url": ("AnyUrl", None),
+    "uri": ("AnyUrl", None),
+    "uuid": ("UUID", None),
+    "color-hex": ("str", f"pattern={_COLOR_HEX_PATTERN!r}"),
+}
+_PLAIN_STRING: tuple[str, str | None] = ("str", None)
+
+# The only keywords that affect a non-enum string expression.
+_CONSTRAINT_KEYS = ("format", "minLength", "maxLength", "pattern")
 
 
 def convert_openapi_string_to_pydantic(schema: dict[str, Any]) -> str:
     if isinstance(schema.get("enum"), list):
-        values = ", ".join(repr(value) for value in schema["enum"])
-        return f"Literal[{values}]"
+        return format_literal(schema["enum"])
+
+    # Value types are part of the cache key so that e.g. a float minLength is not
+    # served the int rendering.
+    typed_constraints = tuple((type(value), value) for value in map(schema.get, _CONSTRAINT_KEYS))
+    try:
+        hash(typed_constraints)
+    except TypeError:
+        # Unhashable keyword values bypass the cache.
+        return _render_constraints(*(value for _, value in typed_constraints))
+    return _convert_typed_constraints(typed_constraints)
+
+
+@lru_cache(maxsize=4096)
+def _convert_typed_constraints(typed_constraints: tuple[tuple[type, Any], ...]) -> str:
+    return _render_constraints(*(value for _, value in typed_constraints))
+
 
-    fmt = schema.get("format")
+# Registered formats change the rendered output.
+schema_registry.add_change_listener(_convert_typed_constraints.cache_clear)
+
+
+def _render_constraints(fmt: Any, min_length: Any, max_length: Any, pattern: Any) -> str:
     if isinstance(fmt, str) and fmt:
         custom_schema = get_schema_exported_variable_name_for_string_format(fmt)
         if custom_schema:
@@ -19,21 +55,7 @@ def convert_openapi_string_to_pydantic(schema: dict[str, Any]) -> str:
     else:
         fmt = None
 
-    base = "str"
-    if fmt == "email":
-        base = "EmailStr"
-    elif fmt in {"url", "uri"}:
-        base = "AnyUrl"
-    elif fmt == "uuid":
-        base = "UUID"
-
-    min_length = schema.get("minLength")
-    max_length = schema.get("maxLength")
-    pattern = schema.get("pattern")
-    pattern_is_explicit = isinstance(pattern, str)
-
-    if fmt == "color-hex" and not pattern_is_explicit:
-        pattern = "^[a-fA-F0-9]{6}$"
+    base, default_pattern_arg = _FORMAT_HANDLERS.get(fmt, _PLAIN_STRING) if fmt else _PLAIN_STRING
 
     field_args: list[str] = []
     if base == "str":
@@ -44,19 +66,22 @@ def convert_openapi_string_to_pydantic(schema: dict[str, Any]) -> str:
         field_args.append(f"max_length={max_length}")
     if isinstance(pattern, str):
         field_args.append(f"pattern={pattern!r}")
+    elif default_pattern_arg is not None:
+        field_args.append(default_pattern_arg)
 
-    meta: dict[str, Any] = {}
+    # Collected in key order, so the metadata is rendered without sorting.
+    meta: list[tuple[str, type, Any]] = []
     if isinstance(fmt, str):
-        meta["format"] = fmt
-    if isinstance(pattern, str) and pattern_is_explicit:
-        meta["pattern"] = pattern
-    if isinstance(min_length, int):
-        meta["minLength"] = min_length
+        meta.append(("format", type(fmt), fmt))
     if isinstance(max_length, int):
-        meta["maxLength"] = max_length
+        meta.append(("maxLength", type(max_length), max_length))
+    if isinstance(min_length, int):
+        meta.append(("minLength", type(min_length), min_length))
+    if isinstance(pattern, str):
+        meta.append(("pattern", type(pattern), pattern))
 
     if meta:
-        field_args.append(format_openapi_metadata(meta))
+        field_args.append(format_openapi_metadata_items(tuple(meta)))
 
     if field_args:
         return wrap_annotated(base, [f"Field({', '.join(field_args)})"])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Callable
 
 from ..type_render import format_openapi_metadata, wrap_annotated
@@ -13,11 +14,11 @@ def convert_openapi_union_to_pydantic(
     if not isinstance(items, list):
         return "Any"
 
-    item_types = [convert_schema(item) for item in items if isinstance(item, dict)]
+    item_types = tuple(convert_schema(item) for item in items if isinstance(item, dict))
     if not item_types:
         return "Any"
 
-    union_expr = f"Union[{', '.join(item_types)}]" if len(item_types) > 1 else item_types[0]
+    union_expr = _join_union(item_types)
 
     discriminator = schema.get("discriminator")
     field_args: list[str] = []
@@ -35,3 +36,9 @@ def convert_openapi_union_to_pydantic(
         return wrap_annotated(union_expr, [f"Field({', '.join(field_args)})"])
 
     return union_expr
+
+
+@lru_cache(maxsize=2048)
+def _join_union(item_types: tuple[str, ...]) -> str:
+    # Members are rendered expressions, so the result depends on nothing else.
+    return f"Union[{', '.join(item_types)}]" if len(item_types) > 1 else item_types[0]
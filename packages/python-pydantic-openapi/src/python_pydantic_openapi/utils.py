@@ -2,26 +2,36 @@ from __future__ import annotations
 
 import keyword
 import re
+from functools import lru_cache
 
-_VALID_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_PY_KEYWORDS = frozenset(keyword.kwlist)
+_ALNUM_RUN = re.compile(r"[^\W_]+")
+_NON_ALNUM_RUN = re.compile(r"[^A-Za-z0-9]+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
 
 
+@lru_cache(maxsize=4096)
 def to_pascal_case(value: str) -> str:
-    parts = re.split(r"[^A-Za-z0-9]+", value)
+    parts = _NON_ALNUM_RUN.split(value)
     return "".join(part[:1].upper() + part[1:] for part in parts if part)
 
 
+def to_capitalized_pascal_case(value: str) -> str:
+    return "".join(part[:1].upper() + part[1:].lower() for part in _ALNUM_RUN.findall(value))
+
+
 def to_snake_case(value: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_")
+    value = _NON_ALNUM_RUN.sub("_", value).strip("_")
     if not value:
         return "field"
-    value = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", value)
+    value = _CAMEL_BOUNDARY.sub(r"\1_\2", value)
     return value.lower()
 
 
 def safe_identifier(name: str, used: set[str]) -> tuple[str, bool]:
     candidate = to_snake_case(name)
-    if not _VALID_IDENTIFIER.match(candidate) or keyword.iskeyword(candidate):
+    # to_snake_case only emits ASCII, so isidentifier() matches the ASCII identifier rule.
+    if not candidate.isidentifier() or candidate in _PY_KEYWORDS:
         candidate = f"_{candidate}"
     base = candidate
     idx = 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from textwrap import dedent
 from typing import Any
 
@@ -15,13 +16,17 @@ PREAMBLE = dedent(
     from datetime import date, datetime
     from uuid import UUID
 
-    from pydantic import BaseModel, ConfigDict, Field, RootModel
-    from pydantic import AnyUrl, EmailStr
+    from pydantic.config import ConfigDict
+    from pydantic.fields import Field
+    from pydantic.main import BaseModel
+    from pydantic.networks import AnyUrl, EmailStr
+    from pydantic.root_model import RootModel
     from python_pydantic_openapi.all_of import all_of
     """
 ).strip()
 
 
+@lru_cache(maxsize=1024)
 def normalize(text: str) -> str:
     return dedent(text).strip()
 
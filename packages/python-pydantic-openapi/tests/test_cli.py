@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from python_pydantic_openapi.cli import main
+from python_pydantic_openapi.registry import clear_pydantic_schema_registry
+
+
+def setup_function() -> None:
+    clear_pydantic_schema_registry()
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, *args: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["python-pydantic-openapi", *args])
+    try:
+        main()
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    return 0
+
+
+def test_failed_generation_keeps_existing_output(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    spec = tmp_path / "openapi.json"
+    spec.write_text(
+        json.dumps(
+            {
+                "components": {
+                    "schemas": {
+                        "User": {
+                            "type": "object",
+                            "properties": {"id": {"type": "string"}},
+                            "required": [["id"]],
+                        }
+                    }
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    output = tmp_path / "generated.py"
+    output.write_text("# previous output\n", encoding="utf-8")
+
+    assert _run(monkeypatch, str(spec), "-o", str(output)) == 1
+    assert output.read_text(encoding="utf-8") == "# previous output\n"
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b'\xef\xbb\xbf{"components": {"schemas": {"User": {"type": "string"}}}}',
+        b'{"components": {"schemas": {"User": {"type": "number", "maximum": NaN}}}}',
+    ],
+)
+def test_accepts_json_the_stdlib_accepts(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, raw: bytes
+) -> None:
+    spec = tmp_path / "openapi.json"
+    spec.write_bytes(raw)
+    output = tmp_path / "generated.py"
+
+    assert _run(monkeypatch, str(spec), "-o", str(output)) == 0
+    assert "User" in output.read_text(encoding="utf-8")
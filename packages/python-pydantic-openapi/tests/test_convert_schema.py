@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import pytest
 
-from python_pydantic_openapi.registry import clear_pydantic_schema_registry
+from python_pydantic_openapi.registry import (
+    clear_pydantic_schema_registry,
+    register_pydantic_type_to_openapi_schema,
+)
+from python_pydantic_openapi.rendering import RenderContext, schema_to_type_expr
 from python_pydantic_openapi.to_python import convert_schema_to_pydantic_string
 
 
@@ -92,6 +96,10 @@ def test_enum_string() -> None:
     )
 
 
+def test_enum_with_unhashable_values() -> None:
+    assert convert_schema_to_pydantic_string({"enum": [{"a": 1}, "x"]}) == "Literal[{'a': 1}, 'x']"
+
+
 def test_enum_number() -> None:
     assert convert_schema_to_pydantic_string({"type": "number", "enum": [1, 2]}) == "Literal[1, 2]"
 
@@ -160,3 +168,33 @@ def test_string_constraints() -> None:
 )
 def test_string_formats(schema: dict, expected: str) -> None:
     assert convert_schema_to_pydantic_string(schema) == expected
+
+
+def test_registration_invalidates_rendered_schema() -> None:
+    schema = {"type": "string", "format": "email"}
+    assert convert_schema_to_pydantic_string(schema).startswith("Annotated[EmailStr")
+    register_pydantic_type_to_openapi_schema(
+        object(),
+        {
+            "schema_exported_variable_name": "custom_email",
+            "type": "string",
+            "format": "email",
+            "description": None,
+        },
+    )
+    assert convert_schema_to_pydantic_string(schema) == "custom_email"
+
+
+def test_mutated_schema_is_rendered_again() -> None:
+    schema: dict = {"type": "string"}
+    assert convert_schema_to_pydantic_string(schema) == "Annotated[str, Field(strict=True)]"
+    schema["type"] = "boolean"
+    assert convert_schema_to_pydantic_string(schema) == "Annotated[bool, Field(strict=True)]"
+
+
+def test_render_context_memoizes_equal_schemas() -> None:
+    context = RenderContext()
+    first = schema_to_type_expr({"type": "string", "maxLength": 3}, context=context)
+    assert len(context.type_exprs) == 1
+    assert schema_to_type_expr({"maxLength": 3, "type": "string"}, context=context) == first
+    assert len(context.type_exprs) == 1
@@ -114,3 +114,13 @@ def test_topological_sort_circular() -> None:
     }
     result = topological_sort_schemas(schemas)
     assert set(result) == {"A", "B"}
+
+
+def test_topological_sort_sees_mutated_schema() -> None:
+    schemas: dict = {
+        "A": {"type": "object", "properties": {"id": {"type": "string"}}},
+        "B": {"type": "object", "properties": {"id": {"type": "string"}}},
+    }
+    assert topological_sort_schemas(schemas) == ["A", "B"]
+    schemas["A"]["properties"]["b"] = {"$ref": "#/components/schemas/B"}
+    assert topological_sort_schemas(schemas) == ["B", "A"]
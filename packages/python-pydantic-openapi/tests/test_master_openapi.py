@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import importlib.util
 import json
 import sys
 import types
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Annotated, Any, Literal, Union, cast, get_args, get_origin
+from typing import Annotated, Any, Literal, Union, cast
 from uuid import UUID
 
 import pytest
@@ -20,69 +20,119 @@ from python_pydantic_openapi.schema_dedup import get_schema_fingerprint
 from python_pydantic_openapi.to_python import openapi_to_pydantic_code
 
 
+@lru_cache(maxsize=1)
 def _load_fixture() -> dict[str, Any]:
     spec_path = Path(__file__).resolve().parents[2] / "openapi-test-spec" / "openapi.json"
     return json.loads(spec_path.read_text(encoding="utf-8"))
 
 
 def _strip_examples(value: Any) -> Any:
+    # Returns ``value`` itself when nothing below it carried examples.
     if isinstance(value, list):
-        return [_strip_examples(item) for item in value]
+        items = [_strip_examples(item) for item in value]
+        if any(new is not old for new, old in zip(items, value)):
+            return items
+        return value
     if isinstance(value, dict):
+        changed = "x-altstack-examples" in value
         result = {}
         for key, child in value.items():
             if key == "x-altstack-examples":
                 continue
-            result[key] = _strip_examples(child)
-        return result
+            stripped = _strip_examples(child)
+            changed = changed or stripped is not child
+            result[key] = stripped
+        return result if changed else value
     return value
 
 
+_COMPONENT_REF_PREFIX = "#/components/schemas/"
+
+
 def _collect_component_refs(value: Any) -> set[str]:
     refs: set[str] = set()
-    if isinstance(value, list):
-        for item in value:
-            refs.update(_collect_component_refs(item))
-        return refs
-    if isinstance(value, dict):
-        ref = value.get("$ref")
-        if isinstance(ref, str) and ref.startswith("#/components/schemas/"):
-            refs.add(ref.split("#/components/schemas/")[1])
-        for child in value.values():
-            refs.update(_collect_component_refs(child))
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(current)
+        elif isinstance(current, dict):
+            ref = current.get("$ref")
+            if isinstance(ref, str) and ref.startswith(_COMPONENT_REF_PREFIX):
+                refs.add(ref[len(_COMPONENT_REF_PREFIX) :])
+            stack.extend(current.values())
     return refs
 
 
 def _load_module(code: str) -> types.ModuleType:
-    with TemporaryDirectory() as tmp:
-        path = Path(tmp) / "generated.py"
-        path.write_text(code, encoding="utf-8")
-        spec = importlib.util.spec_from_file_location("generated", path)
-        assert spec and spec.loader
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-
-
-def _unwrap_annotated(tp: Any) -> tuple[Any, FieldInfo | None]:
-    if get_origin(tp) is Annotated:
-        args = get_args(tp)
-        base = args[0]
-        field_info = next((m for m in args[1:] if isinstance(m, FieldInfo)), None)
-        return base, field_info
-    return tp, None
-
-
-def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
-    origin = get_origin(tp)
-    if origin in {Union, types.UnionType}:
-        args = list(get_args(tp))
-        if type(None) in args:
-            args = [arg for arg in args if arg is not type(None)]
-            if len(args) == 1:
-                return args[0], True
-            return Union[tuple(args)], True
-    return tp, False
+    module = types.ModuleType("generated")
+    module.__file__ = "<generated>"
+    # Pydantic resolves deferred annotations through sys.modules[model.__module__].
+    sys.modules["generated"] = module
+    exec(compile(code, "<generated>", "exec"), module.__dict__)
+    return module
+
+
+# typing.get_origin/get_args dispatch over every special form; the annotations seen here
+# only need these attribute reads.
+def _origin(tp: Any) -> Any:
+    if isinstance(tp, types.UnionType):
+        return types.UnionType
+    if hasattr(tp, "__metadata__"):
+        return Annotated
+    return getattr(tp, "__origin__", None)
+
+
+def _args(tp: Any) -> tuple[Any, ...]:
+    return getattr(tp, "__args__", ())
+
+
+_UNION_ORIGINS = frozenset({Union, types.UnionType})
+_NONE_TYPE = type(None)
+
+
+# Unwrapped (base, field_info, nullable, origin) per annotation object; entries keep the
+# annotation alive and are identity-checked so a recycled id never matches.
+_UNWRAP_CACHE: dict[int, tuple[Any, Any, FieldInfo | None, bool, Any]] = {}
+
+_PRIMITIVE_SCHEMAS: dict[Any, dict[str, Any]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    EmailStr: {"type": "string", "format": "email"},
+    AnyUrl: {"type": "string", "format": "url"},
+    UUID: {"type": "string", "format": "uuid"},
+    datetime: {"type": "string", "format": "date-time"},
+    date: {"type": "string", "format": "date"},
+}
+
+
+def _unwrap(tp: Any) -> tuple[Any, FieldInfo | None, bool, Any]:
+    cached = _UNWRAP_CACHE.get(id(tp))
+    if cached is not None and cached[0] is tp:
+        return cached[1:]
+
+    # Peel Annotated and Optional layers in one pass; the outermost FieldInfo wins.
+    base = tp
+    field_info: FieldInfo | None = None
+    nullable = False
+    while True:
+        metadata = getattr(base, "__metadata__", None)
+        if metadata is not None:
+            if field_info is None:
+                field_info = next((m for m in metadata if isinstance(m, FieldInfo)), None)
+            base = base.__origin__
+            continue
+        if not nullable and _origin(base) in _UNION_ORIGINS and _NONE_TYPE in base.__args__:
+            nullable = True
+            rest = tuple(arg for arg in base.__args__ if arg is not _NONE_TYPE)
+            base = rest[0] if len(rest) == 1 else cast(Any, Union[rest])
+            continue
+        break
+    result = (base, field_info, nullable, _origin(base))
+    _UNWRAP_CACHE[id(tp)] = (tp, *result)
+    return result
 
 
 def _apply_openapi_meta(schema: dict[str, Any], field_info: FieldInfo | None) -> None:
@@ -112,13 +162,20 @@ def _to_openapi_schema(
     type_to_name: dict[Any, str],
     self_name: str | None = None,
     schema_fingerprint_to_name: dict[str, str] | None = None,
+    memo: dict[int, tuple[Any, dict[str, Any]]] | None = None,
 ) -> dict[str, Any]:
     raw = tp
 
-    base, field_info = _unwrap_annotated(raw)
-    base, nullable = _unwrap_optional(base)
-    if field_info is None:
-        base, field_info = _unwrap_annotated(base)
+    # Results only depend on ``tp`` and ``type_to_name`` when no self-reference or
+    # fingerprint matching is involved; memoize those and hand out copies, since callers
+    # update the returned schema in place.
+    memoize = memo is not None and self_name is None and not schema_fingerprint_to_name
+    if memoize:
+        cached = memo.get(id(raw))
+        if cached is not None and cached[0] is raw:
+            return dict(cached[1])
+
+    base, field_info, nullable, origin = _unwrap(raw)
 
     raw_name = type_to_name.get(raw)
     if raw_name and raw_name != self_name:
@@ -136,9 +193,8 @@ def _to_openapi_schema(
 
     schema: dict[str, Any]
 
-    origin = get_origin(base)
     if origin is Literal:
-        values = list(get_args(base))
+        values = list(base.__args__)
         schema = {"enum": values}
         if all(isinstance(v, str) for v in values):
             schema["type"] = "string"
@@ -148,18 +204,18 @@ def _to_openapi_schema(
             schema["type"] = "integer"
         elif all(isinstance(v, (int, float)) for v in values):
             schema["type"] = "number"
-    elif origin in {Union, types.UnionType}:
-        items = [_to_openapi_schema(item, type_to_name) for item in get_args(base)]
+    elif origin in _UNION_ORIGINS:
+        items = [_to_openapi_schema(item, type_to_name, memo=memo) for item in base.__args__]
         schema = {"oneOf": items}
     elif origin is list:
-        args = get_args(base)
-        items = _to_openapi_schema(args[0], type_to_name) if args else {}
+        args = _args(base)
+        items = _to_openapi_schema(args[0], type_to_name, memo=memo) if args else {}
         schema = {"type": "array", "items": items}
     elif origin is dict:
-        args = get_args(base)
+        args = _args(base)
         schema = {"type": "object"}
         if len(args) == 2 and args[1] is not Any:
-            schema["additionalProperties"] = _to_openapi_schema(args[1], type_to_name)
+            schema["additionalProperties"] = _to_openapi_schema(args[1], type_to_name, memo=memo)
     elif isinstance(base, type) and issubclass(base, RootModel):
         root_field = base.model_fields["root"]
         schema = _to_openapi_schema(
@@ -167,6 +223,7 @@ def _to_openapi_schema(
             type_to_name,
             self_name=self_name,
             schema_fingerprint_to_name=schema_fingerprint_to_name,
+            memo=memo,
         )
         _apply_openapi_meta(schema, None)
     elif isinstance(base, type) and issubclass(base, BaseModel):
@@ -181,6 +238,7 @@ def _to_openapi_schema(
                     field.annotation,
                     type_to_name,
                     schema_fingerprint_to_name=schema_fingerprint_to_name,
+                    memo=memo,
                 )
                 if "$ref" not in field_schema:
                     extra = field.json_schema_extra or {}
@@ -212,34 +270,17 @@ def _to_openapi_schema(
                 schema["additionalProperties"] = False
             extra_annotation = _get_extra_annotation(base)
             if extra_annotation is not None:
-                origin = get_origin(extra_annotation)
-                args = get_args(extra_annotation)
+                origin = _origin(extra_annotation)
+                args = _args(extra_annotation)
                 if origin is dict and len(args) == 2 and args[0] is str:
                     schema["additionalProperties"] = _to_openapi_schema(
                         args[1],
                         type_to_name,
                         schema_fingerprint_to_name=schema_fingerprint_to_name,
+                        memo=memo,
                     )
-    elif base is str:
-        schema = {"type": "string"}
-    elif base is int:
-        schema = {"type": "integer"}
-    elif base is float:
-        schema = {"type": "number"}
-    elif base is bool:
-        schema = {"type": "boolean"}
-    elif base is EmailStr:
-        schema = {"type": "string", "format": "email"}
-    elif base is AnyUrl:
-        schema = {"type": "string", "format": "url"}
-    elif base is UUID:
-        schema = {"type": "string", "format": "uuid"}
-    elif base is datetime:
-        schema = {"type": "string", "format": "date-time"}
-    elif base is date:
-        schema = {"type": "string", "format": "date"}
     else:
-        schema = {}
+        schema = dict(_PRIMITIVE_SCHEMAS.get(base, {}))
 
     _apply_openapi_meta(schema, field_info)
 
@@ -257,14 +298,23 @@ def _to_openapi_schema(
                 ref_schema["nullable"] = True
             return ref_schema
 
+    if memoize:
+        memo[id(raw)] = (raw, schema)
+        return dict(schema)
     return schema
 
 
-def test_master_openapi_fixture() -> None:
+@pytest.fixture(scope="module")
+def generated_module() -> Iterator[types.ModuleType]:
     clear_pydantic_schema_registry()
+    code = openapi_to_pydantic_code(_load_fixture(), options={"include_routes": True})
+    yield _load_module(code)
+    sys.modules.pop("generated", None)
+
+
+def test_master_openapi_fixture(generated_module: types.ModuleType) -> None:
     spec = _load_fixture()
-    code = openapi_to_pydantic_code(spec, options={"include_routes": True})
-    module = _load_module(code)
+    module = generated_module
 
     schemas = spec.get("components", {}).get("schemas", {})
     type_to_name = {getattr(module, name): name for name in schemas}
@@ -281,7 +331,15 @@ def test_master_openapi_fixture() -> None:
                 model.model_validate(value)
 
     expected = _strip_examples(spec)
-    actual = deepcopy(expected)
+    # Only paths are edited in place; component schemas are replaced wholesale, so the
+    # rest of the spec can be shared with ``expected``.
+    actual = {key: deepcopy(value) if key == "paths" else value for key, value in expected.items()}
+    if "components" in expected:
+        expected_components = expected["components"]
+        actual["components"] = {
+            **expected_components,
+            "schemas": dict(expected_components.get("schemas", {})),
+        }
     referenced_components = _collect_component_refs(expected)
     schema_fingerprint_to_name = {
         get_schema_fingerprint(schema): name
@@ -289,12 +347,14 @@ def test_master_openapi_fixture() -> None:
         if name in referenced_components
     }
 
+    memo: dict[int, tuple[Any, dict[str, Any]]] = {}
     for name in schemas:
         actual["components"]["schemas"][name] = _to_openapi_schema(
             getattr(module, name),
             type_to_name,
             self_name=name,
             schema_fingerprint_to_name=schema_fingerprint_to_name,
+            memo=memo,
         )
 
     request_map = getattr(module, "Request", {})
@@ -341,6 +401,7 @@ def test_master_openapi_fixture() -> None:
                     container_schema = _to_openapi_schema(
                         container,
                         type_to_name,
+                        memo=memo,
                     )
                     if (
                         isinstance(container_schema.get("properties"), dict)
@@ -358,6 +419,7 @@ def test_master_openapi_fixture() -> None:
                             request_entry["body"],
                             type_to_name,
                             schema_fingerprint_to_name=schema_fingerprint_to_name,
+                            memo=memo,
                         )
                         json_content["schema"] = schema_obj
 
@@ -379,6 +441,7 @@ def test_master_openapi_fixture() -> None:
                         response_model,
                         type_to_name,
                         schema_fingerprint_to_name=schema_fingerprint_to_name,
+                        memo=memo,
                     )
 
     assert actual == expected
@@ -34,3 +34,18 @@ def test_min_max() -> None:
         "json_schema_extra={'openapi': {'maximum': 10, 'minimum': 1}})]"
     )
     assert result == expected
+
+
+def test_float_bounds_render_as_floats_after_int_bounds() -> None:
+    convert_openapi_number_to_pydantic({"type": "number", "minimum": 1})
+    result = convert_openapi_number_to_pydantic({"type": "number", "minimum": 1.0})
+    expected = (
+        "Annotated[float, Field(strict=True, ge=1.0, "
+        "json_schema_extra={'openapi': {'minimum': 1.0}})]"
+    )
+    assert result == expected
+
+
+def test_enum_literals_keep_value_types() -> None:
+    assert convert_openapi_number_to_pydantic({"type": "integer", "enum": [1]}) == "Literal[1]"
+    assert convert_openapi_number_to_pydantic({"type": "number", "enum": [1.0]}) == "Literal[1.0]"
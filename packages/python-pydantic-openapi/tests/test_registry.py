@@ -3,6 +3,8 @@ from __future__ import annotations
 import pytest
 
 from python_pydantic_openapi.registry import (
+    PydanticOpenApiRegistrationString,
+    PydanticSchemaRegistry,
     clear_pydantic_schema_registry,
     get_schema_exported_variable_name_for_string_format,
     register_pydantic_type_to_openapi_schema,
@@ -100,3 +102,51 @@ def test_register_primitive_types() -> None:
         },
     )
     assert schema_registry.is_registered(number_schema)
+
+
+def test_reregistering_same_schema_does_not_notify() -> None:
+    registry = PydanticSchemaRegistry()
+    changes: list[None] = []
+    registry.add_change_listener(lambda: changes.append(None))
+    schema = object()
+    registration: PydanticOpenApiRegistrationString = {
+        "schema_exported_variable_name": "email_schema",
+        "type": "string",
+        "format": "email",
+        "description": None,
+    }
+    registry.register(schema, registration)
+    registry.register(schema, registration.copy())
+    assert len(changes) == 1
+    assert registry.is_registered(schema)
+    assert not registry.is_registered(object())
+
+
+def test_reregistering_mutated_registration_applies_it() -> None:
+    registry = PydanticSchemaRegistry()
+    schema = object()
+    registration: PydanticOpenApiRegistrationString = {
+        "schema_exported_variable_name": "custom_string",
+        "type": "string",
+        "format": "email",
+        "description": None,
+    }
+    registry.register(schema, registration)
+    registration["format"] = "uuid"
+    registry.register(schema, registration)
+    assert registry.get_schema_exported_variable_name_for_string_format("uuid") == "custom_string"
+
+
+def test_clearing_empty_registry_does_not_notify() -> None:
+    registry = PydanticSchemaRegistry()
+    changes: list[None] = []
+    registry.add_change_listener(lambda: changes.append(None))
+    registry.clear()
+    assert changes == []
+    registry.register(
+        object(),
+        {"schema_exported_variable_name": "number_schema", "type": "number", "description": None},
+    )
+    registry.clear()
+    registry.clear()
+    assert len(changes) == 2
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from python_pydantic_openapi.registry import (
     clear_pydantic_schema_registry,
     register_pydantic_type_to_openapi_schema,
@@ -121,3 +123,48 @@ def test_custom_registry_overrides() -> None:
     )
     result = convert_openapi_string_to_pydantic({"type": "string", "format": "email"})
     assert result == "custom_email"
+
+
+def test_registry_changes_invalidate_cached_rendering() -> None:
+    schema = {"type": "string", "format": "email"}
+    assert convert_openapi_string_to_pydantic(schema).startswith("Annotated[EmailStr")
+    register_pydantic_type_to_openapi_schema(
+        object(),
+        {
+            "schema_exported_variable_name": "custom_email",
+            "type": "string",
+            "format": "email",
+            "description": None,
+        },
+    )
+    assert convert_openapi_string_to_pydantic(schema) == "custom_email"
+    clear_pydantic_schema_registry()
+    assert convert_openapi_string_to_pydantic(schema).startswith("Annotated[EmailStr")
+
+
+def test_unhashable_constraints_bypass_cache() -> None:
+    assert (
+        convert_openapi_string_to_pydantic({"type": "string", "pattern": ["^a"]})
+        == "Annotated[str, Field(strict=True)]"
+    )
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "string", "format": "uuid", "maxLength": 36},
+        {"type": "string", "format": "uuid", "pattern": ["unhashable"]},
+    ],
+)
+def test_registration_applies_to_constrained_strings(schema: dict) -> None:
+    assert convert_openapi_string_to_pydantic(schema).startswith("Annotated[UUID")
+    register_pydantic_type_to_openapi_schema(
+        object(),
+        {
+            "schema_exported_variable_name": "custom_uuid",
+            "type": "string",
+            "format": "uuid",
+            "description": None,
+        },
+    )
+    assert convert_openapi_string_to_pydantic(schema) == "custom_uuid"
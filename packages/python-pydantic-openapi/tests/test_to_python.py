@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import importlib.util
+import io
+import sys
 import types
-from pathlib import Path
-from tempfile import TemporaryDirectory
-from uuid import UUID
+from datetime import date
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import ValidationError
@@ -13,6 +13,7 @@ from python_pydantic_openapi.registry import (
     clear_pydantic_schema_registry,
     register_pydantic_type_to_openapi_schema,
 )
+from python_pydantic_openapi.schema_dedup import get_schema_fingerprint
 from python_pydantic_openapi.to_python import openapi_to_pydantic_code
 from tests.codegen_assertions import assert_generated_code
 
@@ -21,15 +22,13 @@ def setup_function() -> None:
     clear_pydantic_schema_registry()
 
 
-def _load_module(code: str) -> types.ModuleType:
-    with TemporaryDirectory() as tmp:
-        path = Path(tmp) / "generated.py"
-        path.write_text(code, encoding="utf-8")
-        spec = importlib.util.spec_from_file_location("generated", path)
-        assert spec and spec.loader
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
+def _load_module(monkeypatch: pytest.MonkeyPatch, code: str) -> types.ModuleType:
+    module = types.ModuleType("generated")
+    module.__file__ = "<generated>"
+    # Pydantic resolves deferred annotations through sys.modules[model.__module__].
+    monkeypatch.setitem(sys.modules, "generated", module)
+    exec(compile(code, "<generated>", "exec"), module.__dict__)
+    return module
 
 
 def test_route_generation_basic() -> None:
@@ -524,7 +523,7 @@ def test_array_of_object_items_preserves_item_shape() -> None:
     )
 
 
-def test_generated_map_model_validates_value_type() -> None:
+def test_generated_map_model_validates_value_type(monkeypatch: pytest.MonkeyPatch) -> None:
     openapi = {
         "components": {
             "schemas": {
@@ -536,7 +535,7 @@ def test_generated_map_model_validates_value_type() -> None:
         }
     }
 
-    module = _load_module(openapi_to_pydantic_code(openapi))
+    module = _load_module(monkeypatch, openapi_to_pydantic_code(openapi))
     model = module.TagMap.model_validate({"primary": "blue"})
     assert model.root == {"primary": "blue"}
 
@@ -544,7 +543,7 @@ def test_generated_map_model_validates_value_type() -> None:
         module.TagMap.model_validate({"primary": 123})
 
 
-def test_generated_array_item_model_validates_item_shape() -> None:
+def test_generated_array_item_model_validates_item_shape(monkeypatch: pytest.MonkeyPatch) -> None:
     openapi = {
         "components": {
             "schemas": {
@@ -563,7 +562,7 @@ def test_generated_array_item_model_validates_item_shape() -> None:
         }
     }
 
-    module = _load_module(openapi_to_pydantic_code(openapi))
+    module = _load_module(monkeypatch, openapi_to_pydantic_code(openapi))
     model = module.Users.model_validate([{"id": "1"}, {"id": "2", "name": "Ada"}])
     assert len(model.root) == 2
 
@@ -571,7 +570,9 @@ def test_generated_array_item_model_validates_item_shape() -> None:
         module.Users.model_validate([{"name": "missing-id"}])
 
 
-def test_generated_route_models_validate_requests_and_responses() -> None:
+def test_generated_route_models_validate_requests_and_responses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     openapi = {
         "components": {
             "schemas": {
@@ -607,7 +608,9 @@ def test_generated_route_models_validate_requests_and_responses() -> None:
         },
     }
 
-    module = _load_module(openapi_to_pydantic_code(openapi, options={"include_routes": True}))
+    module = _load_module(
+        monkeypatch, openapi_to_pydantic_code(openapi, options={"include_routes": True})
+    )
     request_model = module.Request["/users/{id}"]["GET"]["params"]
     response_model = module.Response["/users/{id}"]["GET"]["200"]
 
@@ -618,7 +621,7 @@ def test_generated_route_models_validate_requests_and_responses() -> None:
         request_model.model_validate({"id": "123", "extra": True})
 
 
-def test_generated_custom_registry_type_validates() -> None:
+def test_generated_custom_registry_type_validates(monkeypatch: pytest.MonkeyPatch) -> None:
     register_pydantic_type_to_openapi_schema(
         object(),
         {
@@ -641,13 +644,119 @@ def test_generated_custom_registry_type_validates() -> None:
     }
 
     module = _load_module(
+        monkeypatch,
         openapi_to_pydantic_code(
             openapi,
             custom_import_lines=["from uuid import UUID as uuid_schema"],
-        )
+        ),
     )
     model = module.User.model_validate({"id": "12345678-1234-5678-1234-567812345678"})
     assert model.id == UUID("12345678-1234-5678-1234-567812345678")
 
     with pytest.raises(ValidationError):
         module.User.model_validate({"id": "not-a-uuid"})
+
+
+def test_keyword_property_names_get_suffix() -> None:
+    openapi = {
+        "components": {
+            "schemas": {
+                "Item": {
+                    "type": "object",
+                    "properties": {"import": {"type": "string"}, "from": {"type": "string"}},
+                    "required": ["import"],
+                }
+            }
+        }
+    }
+
+    assert_generated_code(
+        openapi,
+        """
+        class Item(BaseModel):
+            model_config = ConfigDict(populate_by_name=True, extra='allow')
+            import_: Annotated[str, Field(strict=True)] = Field(alias='import')
+            from_: Annotated[str, Field(strict=True)] = Field(default=None, alias='from')
+
+        Item.model_rebuild()
+        """,
+    )
+
+
+def test_code_can_be_written_to_a_stream() -> None:
+    openapi = {
+        "components": {
+            "schemas": {
+                "User": {
+                    "type": "object",
+                    "properties": {"id": {"type": "string"}},
+                    "required": ["id"],
+                }
+            }
+        }
+    }
+
+    out = io.StringIO()
+    assert openapi_to_pydantic_code(openapi, out=out) is None
+    assert out.getvalue() == openapi_to_pydantic_code(openapi)
+
+
+def test_minimize_rebuild_only_rebuilds_forward_references(monkeypatch: pytest.MonkeyPatch) -> None:
+    openapi = {
+        "components": {
+            "schemas": {
+                "Tag": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                    "required": ["name"],
+                },
+                "Parent": {
+                    "type": "object",
+                    "properties": {
+                        "tag": {"$ref": "#/components/schemas/Tag"},
+                        "child": {"$ref": "#/components/schemas/Child"},
+                    },
+                },
+                "Child": {
+                    "type": "object",
+                    "properties": {"parent": {"$ref": "#/components/schemas/Parent"}},
+                },
+            }
+        }
+    }
+
+    code = openapi_to_pydantic_code(openapi, options={"minimize_rebuild": True})
+    rebuilds = [line for line in code.splitlines() if line.endswith(".model_rebuild()")]
+    assert len(rebuilds) == 1
+    assert "Tag.model_rebuild()" not in code
+
+    module = _load_module(monkeypatch, code)
+    parent = module.Parent.model_validate({"tag": {"name": "a"}, "child": {"parent": {}}})
+    assert parent.child.parent.tag is None
+
+
+def test_fingerprints_follow_schema_mutation() -> None:
+    schema: dict = {"type": "string"}
+    before = get_schema_fingerprint(schema)
+    schema["type"] = "integer"
+    assert get_schema_fingerprint(schema) != before
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"default": object()},
+        {"default": date(2024, 1, 1)},
+        {"default": uuid4()},
+        {"enum": {1: "a"}},
+    ],
+)
+def test_fingerprint_rejects_non_json_schemas(schema: dict) -> None:
+    with pytest.raises(TypeError, match="not JSON data"):
+        get_schema_fingerprint(schema)
+
+
+def test_fingerprint_accepts_non_finite_numbers() -> None:
+    nan_schema = {"type": "number", "maximum": float("nan")}
+    null_schema = {"type": "number", "maximum": None}
+    assert get_schema_fingerprint(nan_schema) != get_schema_fingerprint(null_schema)